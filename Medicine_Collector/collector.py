@@ -19,7 +19,7 @@ from collections import OrderedDict
 from api.naver_api import search_api, filter_medicine_items
 from parser.html_parser import is_medicine_page, fetch_medicine_data
 from utils.file_utils import save_medicine_data, is_duplicate_medicine, export_to_csv, generate_medicine_id, sanitize_filename
-from utils.keyword_manager import load_keywords, update_keyword_progress, generate_medicine_keywords
+from utils.keyword_manager import load_keywords, update_keyword_progress, update_keyword_progress_bulk, generate_medicine_keywords, flush_keyword_progress, flush_completed_keywords
 from utils.checkpoint import save_checkpoint, load_checkpoint
 from utils.html_report import init_html_report, add_to_html_report, finalize_html_report
 from utils.safety import safe_regex_search, safe_regex_group
@@ -335,11 +335,12 @@ class MedicineCollector:
             })
             
             # HTML 보고서에 데이터 추가
-            add_to_html_report(medicine_data, self.current_html_file, self.current_html_count)
-            self.current_html_count += 1
+            self.current_html_count = add_to_html_report(medicine_data, self.current_html_file, self.current_html_count)
             
             # HTML 파일 아이템 수 제한 체크
             if self.current_html_count >= self.html_item_limit:
+                finalize_html_report(self.current_html_file)
+                flush_completed_keywords(self.output_dir)
                 self._init_new_html_report()
             
             return True, json_path
@@ -426,6 +427,16 @@ class MedicineCollector:
         # 이 함수는 이미 새 디렉토리 구조를 지원하도록 수정됨
         update_keyword_progress(completed_keyword, self.output_dir)
 
+    def update_keyword_progress_bulk(self, completed_keywords):
+        """
+        함께 완료된 키워드들을 한 번에 완료 처리
+        
+        Args:
+            completed_keywords (list): 완료된 키워드 목록
+        """
+        if completed_keywords:
+            update_keyword_progress_bulk(completed_keywords, self.output_dir)
+
     def save_checkpoint(self, keyword, processed_count=0):
         """
         현재 진행 상태 체크포인트 저장
@@ -440,6 +451,9 @@ class MedicineCollector:
             self.stats, 
             self.output_dir
         )
+        
+        # 체크포인트와 함께 대기 중인 완료 키워드 기록 (강제 종료 시 유실 방지)
+        flush_completed_keywords(self.output_dir)
 
     def load_checkpoint(self):
         """
@@ -570,6 +584,9 @@ class MedicineCollector:
             # HTML 보고서 마무리
             finalize_html_report(self.current_html_file)
             
+            # 대기 중인 키워드 진행 상황 기록
+            flush_keyword_progress(self.output_dir)
+            
             # 모든 작업이 취소됨을 보장
             shutdown_event.set()
             logger.info("자원 정리 완료")
@@ -628,7 +645,8 @@ class MedicineCollector:
                         # 계속 대기
                         continue
                     
-                    # 완료된 작업 결과 처리
+                    # 완료된 작업 결과 처리 (진행 상태는 이번에 완료된 키워드를 모아 한 번에 갱신)
+                    completed_keywords = []
                     for future in done:
                         if check_shutdown():
                             break
@@ -641,8 +659,8 @@ class MedicineCollector:
                             result = future.result()
                             keyword_results[keyword] = result
                             
-                            # 키워드 진행 상태 업데이트
-                            self.update_keyword_progress(keyword)
+                            # 키워드 진행 상태 업데이트 대상에 추가
+                            completed_keywords.append(keyword)
                             completed_count += 1
                             
                             # 진행률 출력
@@ -668,6 +686,9 @@ class MedicineCollector:
                             logger.error(f"키워드 '{keyword}' 처리 중 오류: {e}")
                             keyword_results[keyword] = {"error": str(e)}
                     
+                    # 키워드 진행 상태 업데이트
+                    self.update_keyword_progress_bulk(completed_keywords)
+                    
                     # 종료 요청 확인
                     if check_shutdown():
                         break
@@ -18,6 +18,7 @@ from .image_parser import extract_medicine_image
 from .section_parser import extract_detailed_sections, normalize_field_names
 from .profile_parser import extract_supplementary_identification as extract_identification_info_safe
 from utils.safety import safe_regex_search, safe_regex_group
+from utils.file_utils import is_processed_medicine_id
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -133,15 +134,12 @@ def fetch_medicine_data(item, medicine_data=None, max_retries=3, user_agents=Non
     if doc_id_match:
         doc_id = f"M{safe_regex_group(doc_id_match, 1)}"
         # 이미 처리된 ID인지 확인 (중복 처리 방지)
-        existing_ids_path = os.path.join(output_dir, "processed_medicine_ids.txt")
-        if os.path.exists(existing_ids_path):
-            try:
-                with open(existing_ids_path, 'r', encoding='utf-8') as f:
-                    if f"{doc_id}\n" in f.read():
-                        logger.info(f"│  [ID: {doc_id}] 이미 처리된 ID입니다 - 건너뜁니다.")
-                        return None
-            except Exception as e:
-                logger.warning(f"│  [ID: {doc_id}] ID 목록 읽기 오류: {str(e)}")
+        try:
+            if is_processed_medicine_id(doc_id, output_dir):
+                logger.info(f"│  [ID: {doc_id}] 이미 처리된 ID입니다 - 건너뜁니다.")
+                return None
+        except Exception as e:
+            logger.warning(f"│  [ID: {doc_id}] ID 목록 읽기 오류: {str(e)}")
     
     # 로그 식별 텍스트 구성
     log_id = doc_id if doc_id else "Unknown"
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+file_utils 테스트
+"""
+
+import os
+import sys
+import csv
+import json
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import file_utils
+
+
+class ExportToCsvTest(unittest.TestCase):
+    """export_to_csv 테스트"""
+
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+        self.json_dir = os.path.join(self.base_dir, "json")
+        os.makedirs(self.json_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.base_dir, ignore_errors=True)
+
+    def _write_json(self, name, data):
+        path = os.path.join(self.json_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        return path
+
+    def _export_rows(self):
+        output_path = file_utils.export_to_csv({}, self.json_dir, os.path.join(self.base_dir, "out", "medicine.csv"))
+        self.assertIsNotNone(output_path)
+        with open(output_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            return [dict(zip(header, row)) for row in reader]
+
+    def test_long_text_field_truncated_in_csv_only(self):
+        path = self._write_json("long.json", {'korean_name': '타이레놀', 'efficacy': '가' * 1500})
+
+        rows = self._export_rows()
+
+        self.assertEqual(len(rows[0]['efficacy']), file_utils._TRUNC_LENGTH)
+        self.assertTrue(rows[0]['efficacy'].endswith('...'))
+        with open(path, 'r', encoding='utf-8') as f:
+            self.assertEqual(len(json.load(f)['efficacy']), 1500)
+
+    def test_list_valued_field_longer_than_limit(self):
+        components = [f"성분{i}" for i in range(1200)]
+        self._write_json("list.json", {'korean_name': '게보린', 'components': components})
+
+        rows = self._export_rows()
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['korean_name'], '게보린')
+        self.assertEqual(rows[0]['components'], str(components))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+keyword_manager 테스트
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import keyword_manager
+
+
+class KeywordStoreReloadTest(unittest.TestCase):
+    """키워드 파일 변경 감지 테스트"""
+
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.keywords_dir = os.path.join(self.output_dir, "keywords")
+        os.makedirs(self.keywords_dir)
+        self.todo_path = os.path.join(self.keywords_dir, "keywords_todo.txt")
+        with open(self.todo_path, 'w', encoding='utf-8') as f:
+            f.write("가나다\n라마바\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def _restore_mtime(self, st):
+        # mtime 해상도 안에서 다시 기록된 것처럼 이전 mtime으로 되돌림
+        os.utime(self.todo_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    def test_same_length_replace_is_reloaded(self):
+        self.assertEqual(keyword_manager.load_keywords(self.output_dir), ["가나다", "라마바"])
+        st = os.stat(self.todo_path)
+
+        # 외부 도구가 같은 길이의 내용으로 파일을 교체
+        tmp_path = self.todo_path + ".new"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write("사아자\n차카타\n")
+        os.replace(tmp_path, self.todo_path)
+        self._restore_mtime(st)
+        self.assertEqual(os.path.getsize(self.todo_path), st.st_size)
+
+        self.assertEqual(keyword_manager.check_keyword_status("사아자", self.output_dir), 'todo')
+        self.assertEqual(keyword_manager.check_keyword_status("가나다", self.output_dir), 'none')
+
+    def test_same_length_in_place_rewrite_is_reloaded(self):
+        self.assertEqual(keyword_manager.load_keywords(self.output_dir), ["가나다", "라마바"])
+        st = os.stat(self.todo_path)
+
+        # ctime이 달라지도록 잠시 대기 후 같은 파일에 같은 길이의 내용 기록
+        time.sleep(0.05)
+        with open(self.todo_path, 'w', encoding='utf-8') as f:
+            f.write("사아자\n차카타\n")
+        self._restore_mtime(st)
+
+        self.assertEqual(keyword_manager.load_keywords(self.output_dir), ["사아자", "차카타"])
+
+
+if __name__ == '__main__':
+    unittest.main()
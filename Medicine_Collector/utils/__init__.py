@@ -3,8 +3,8 @@
 파일 처리, 키워드 관리, 안전 처리 등의 유틸리티 함수를 제공합니다.
 """
 
-from .file_utils import save_medicine_data, is_duplicate_medicine, export_to_csv, generate_medicine_id, sanitize_filename
-from .keyword_manager import load_keywords, update_keyword_progress, generate_medicine_keywords
+from .file_utils import save_medicine_data, is_duplicate_medicine, is_duplicate_medicine_by_id, is_processed_medicine_id, export_to_csv, generate_medicine_id, sanitize_filename
+from .keyword_manager import load_keywords, update_keyword_progress, update_keyword_progress_bulk, generate_medicine_keywords
 from .checkpoint import save_checkpoint, load_checkpoint
 from .html_report import init_html_report, add_to_html_report, finalize_html_report
 from .safety import setup_signal_handlers, sigint_handler, force_exit_handler, watchdog_thread, safe_regex_search, safe_regex_group
\ No newline at end of file
@@ -11,8 +11,18 @@ import re
 import json
 import csv
 import glob
+import atexit
 import logging
+import time
+import sqlite3
+import threading
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -75,6 +85,83 @@ MEDICINE_FIELDS = {
     'collection_time': ''        # 수집 시간
 }
 
+# CSV 열 순서 (MySQL 친화적으로 중요 필드가 먼저 오도록 정렬)
+_CSV_PRIORITY_COLUMNS = (
+    'id', 'korean_name', 'english_name', 'category', 'company',
+    'classification', 'medicine_type', 'insurance_code', 'approval_number',
+    'components', 'components_amount', 'efficacy', 'dosage', 'precautions',
+    'side_effects', 'interactions', 'storage_conditions', 'expiration',
+    'appearance', 'shape', 'color', 'size', 'identification', 'division_line',
+    'image_url', 'url', 'extracted_time', 'collection_time'
+)
+
+# 나머지 표준 필드는 MEDICINE_FIELDS 정의 순서대로 뒤에 추가
+_CSV_COLUMNS = list(_CSV_PRIORITY_COLUMNS) + [key for key in MEDICINE_FIELDS if key not in _CSV_PRIORITY_COLUMNS]
+
+# 파일명에 사용할 수 없는 문자 -> '_' 변환 테이블
+_INVALID_FNAME_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+# URL의 docId 추출 패턴
+_DOCID_RE = re.compile(r'docId=([^&]+)')
+
+# 처리된 의약품 ID 데이터베이스 파일명
+PROCESSED_IDS_DB = "processed_ids.sqlite3"
+
+# CSV 내보내기 시 길이를 제한할 큰 텍스트 필드
+_TRUNC_FIELDS = ('components', 'efficacy', 'precautions', 'dosage')
+_TRUNC_LENGTH = 1000
+
+# 현재 시간 문자열 캐시 [monotonic 시각, ISO 문자열] (1초 단위 재사용)
+_ts_cache = [float('-inf'), '']
+
+def _now_iso_cached():
+    """
+    현재 시간 ISO 문자열 (1초 이내 호출은 캐시 재사용)
+    
+    Returns:
+        str: ISO 형식 시간 문자열
+    """
+    t = time.monotonic()
+    if t - _ts_cache[0] > 1.0:
+        _ts_cache[:] = [t, datetime.now().isoformat()]
+    return _ts_cache[1]
+
+def _write_json(path, data):
+    """
+    JSON 파일 저장 (orjson 사용 가능 시 바이트 단위로 직접 기록)
+    - 임시 파일에 기록 후 os.replace로 교체해 중단 시에도 잘린 파일이 남지 않음
+    
+    Args:
+        path (str): 저장 경로
+        data: 저장할 데이터
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+def _read_json(path):
+    """
+    JSON 파일 로드 (orjson 사용 가능 시 바이트 단위로 파싱)
+    
+    Args:
+        path (str): 파일 경로
+        
+    Returns:
+        JSON 데이터
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
 def sanitize_filename(filename):
     """
     안전한 파일명 생성
@@ -85,29 +172,23 @@ def sanitize_filename(filename):
     Returns:
         str: 안전한 파일명
     """
-    # 파일명에 사용할 수 없는 문자 제거
-    invalid_chars = r'[<>:"/\\|?*]'
-    safe_filename = re.sub(invalid_chars, '_', filename)
-    
-    # 길이 제한
-    if len(safe_filename) > 50:
-        safe_filename = safe_filename[:50]
-    
-    return safe_filename
+    # 파일명에 사용할 수 없는 문자 치환 후 길이 제한
+    return filename.translate(_INVALID_FNAME_TABLE)[:50]
 
-def generate_medicine_id(medicine_data):
+def generate_medicine_id(medicine_data, today_str=None):
     """
     의약품 고유 ID 생성
     
     Args:
         medicine_data: 의약품 데이터
+        today_str (str, optional): ID에 사용할 날짜 (YYYYMMDD, 없으면 현재 날짜)
         
     Returns:
         str: 생성된 ID
     """
     # URL에서 docId 추출 시도
     url = medicine_data.get('url', '') or medicine_data.get('link', '')
-    doc_id_match = re.search(r'docId=([^&]+)', url)
+    doc_id_match = _DOCID_RE.search(url)
     
     if doc_id_match:
         return f"M{doc_id_match.group(1)}"
@@ -116,7 +197,10 @@ def generate_medicine_id(medicine_data):
     name = medicine_data.get('korean_name', '') or medicine_data.get('title', '')
     company = medicine_data.get('company', '')
     
-    id_base = f"{name}_{company}_{datetime.now().strftime('%Y%m%d')}"
+    if today_str is None:
+        today_str = _now_iso_cached()[:10].replace('-', '')
+    
+    id_base = f"{name}_{company}_{today_str}"
     return f"MC{abs(hash(id_base)) % 10000000:07d}"
 
 def standardize_medicine_data(medicine_data):
@@ -129,31 +213,19 @@ def standardize_medicine_data(medicine_data):
     Returns:
         dict: 표준화된 의약품 데이터
     """
-    standardized_data = MEDICINE_FIELDS.copy()
-    
-    # 기존 데이터 복사
-    for key, value in medicine_data.items():
-        if key in standardized_data:
-            # 내용이 있으면 그대로 사용
-            standardized_data[key] = value
+    # 표준 필드 순서대로 한 번에 구성 (누락/빈 값은 "정보 없음")
+    standardized_data = {key: (medicine_data.get(key) or "정보 없음") for key in MEDICINE_FIELDS}
     
-    # 누락된 필드 "정보 없음"으로 채우기
-    for key in standardized_data:
-        if not standardized_data[key] and key in medicine_data:
-            standardized_data[key] = "정보 없음"
-        elif not standardized_data[key] and key not in medicine_data:
-            standardized_data[key] = "정보 없음"
+    # 현재 시간 (1초 단위 캐시)
+    current_time = _now_iso_cached()
     
     # 필수 필드 확인
-    if not standardized_data['id']:
-        standardized_data['id'] = generate_medicine_id(medicine_data)
+    standardized_data['id'] = medicine_data.get('id') or generate_medicine_id(
+        medicine_data, current_time[:10].replace('-', ''))
     
     # 날짜 정보 채우기
-    current_time = datetime.now().isoformat()
-    if not standardized_data['extracted_time']:
-        standardized_data['extracted_time'] = current_time
-    if not standardized_data['collection_time']:
-        standardized_data['collection_time'] = current_time
+    standardized_data['extracted_time'] = medicine_data.get('extracted_time') or current_time
+    standardized_data['collection_time'] = medicine_data.get('collection_time') or current_time
     
     return standardized_data
 
@@ -168,27 +240,132 @@ def is_duplicate_medicine(medicine_data, output_dir):
     Returns:
         bool: 중복 여부
     """
-    # 고유 식별자 기준 중복 체크 (예: URL, ID)
-    existing_ids_path = os.path.join(output_dir, "processed_medicine_ids.txt")
-    
     # 의약품 고유 ID 생성
     medicine_id = medicine_data.get('id') or generate_medicine_id(medicine_data)
     
-    # 이미 처리된 ID 목록 로드
-    processed_ids = set()
-    if os.path.exists(existing_ids_path):
-        with open(existing_ids_path, 'r', encoding='utf-8') as f:
-            processed_ids = set(f.read().splitlines())
+    return is_duplicate_medicine_by_id(medicine_id, output_dir)
+
+class ProcessedIdStore:
+    """
+    처리된 의약품 ID 저장소 (SQLite)
+    - id 기본키로 DB가 직접 중복 방지
+    - 전체 목록을 메모리에 읽지 않고 O(log N) 조회/삽입
+    - 등록마다 커밋 (WAL + synchronous=NORMAL이라 비용이 작고, 중단 시에도 등록된 ID 유지)
+    """
     
-    # 중복 체크
-    if medicine_id in processed_ids:
-        return True
+    def __init__(self, output_dir):
+        os.makedirs(output_dir, exist_ok=True)
+        db_path = os.path.join(output_dir, PROCESSED_IDS_DB)
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS ids(id TEXT PRIMARY KEY) WITHOUT ROWID")
+        self._conn.commit()
+        
+        self._import_legacy_ids(output_dir)
     
-    # 새로운 ID 추가
-    with open(existing_ids_path, 'a', encoding='utf-8') as f:
-        f.write(f"{medicine_id}\n")
+    def _import_legacy_ids(self, output_dir):
+        """기존 processed_medicine_ids.txt 내용을 최초 1회 가져오기"""
+        legacy_path = os.path.join(output_dir, "processed_medicine_ids.txt")
+        if not os.path.exists(legacy_path):
+            return
+        
+        if self._conn.execute("SELECT 1 FROM ids LIMIT 1").fetchone():
+            return
+        
+        with open(legacy_path, 'r', encoding='utf-8') as f:
+            legacy_ids = [(line,) for line in f.read().splitlines() if line]
+        
+        self._conn.executemany("INSERT OR IGNORE INTO ids VALUES(?)", legacy_ids)
+        self._conn.commit()
+        logger.info(f"기존 처리 ID {len(legacy_ids)}개를 {PROCESSED_IDS_DB}로 가져왔습니다.")
     
-    return False
+    def add(self, medicine_id):
+        """
+        ID 등록
+        
+        Args:
+            medicine_id (str): 의약품 고유 ID
+            
+        Returns:
+            bool: 새로 등록되었으면 True, 이미 있으면 False
+        """
+        with self._lock:
+            cursor = self._conn.execute("INSERT OR IGNORE INTO ids VALUES(?)", (medicine_id,))
+            if cursor.rowcount != 1:
+                return False
+            
+            self._conn.commit()
+            return True
+    
+    def contains(self, medicine_id):
+        """ID 등록 여부 확인"""
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM ids WHERE id = ?", (medicine_id,)).fetchone() is not None
+    
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+# output_dir별 ID 저장소
+_id_stores = {}
+_id_stores_lock = threading.Lock()
+
+def _get_id_store(output_dir):
+    """output_dir에 해당하는 ID 저장소 반환 (없으면 생성)"""
+    key = os.path.abspath(output_dir)
+    with _id_stores_lock:
+        store = _id_stores.get(key)
+        if store is None:
+            store = ProcessedIdStore(output_dir)
+            _id_stores[key] = store
+        return store
+
+@atexit.register
+def _close_id_stores():
+    """종료 시 모든 ID 저장소 커밋 및 종료"""
+    with _id_stores_lock:
+        for store in _id_stores.values():
+            try:
+                store.close()
+            except Exception as e:
+                logger.error(f"처리 ID 저장소 종료 중 오류: {e}")
+        _id_stores.clear()
+
+def is_processed_medicine_id(medicine_id, output_dir):
+    """
+    이미 처리된 ID인지 확인 (등록하지 않음)
+    
+    Args:
+        medicine_id (str): 의약품 고유 ID
+        output_dir (str): 출력 디렉토리
+    
+    Returns:
+        bool: 처리 여부
+    """
+    # 조회만으로 디렉토리/DB를 만들지 않도록, 아직 ID 파일이 없으면 처리되지 않은 것으로 판단
+    if not any(os.path.exists(os.path.join(output_dir, name))
+               for name in (PROCESSED_IDS_DB, "processed_medicine_ids.txt")):
+        return False
+    
+    return _get_id_store(output_dir).contains(medicine_id)
+
+def is_duplicate_medicine_by_id(medicine_id, output_dir):
+    """
+    ID 기준 중복 의약품 검사 (새 ID는 처리 목록에 등록)
+    
+    Args:
+        medicine_id (str): 의약품 고유 ID
+        output_dir (str): 출력 디렉토리
+    
+    Returns:
+        bool: 중복 여부
+    """
+    return not _get_id_store(output_dir).add(medicine_id)
 
 def save_medicine_data(medicine_data, json_dir, output_dir):
     """
@@ -209,16 +386,16 @@ def save_medicine_data(medicine_data, json_dir, output_dir):
             logger.warning("저장할 의약품 데이터가 없습니다.")
             return False, None
         
-        # 0. 데이터 표준화
-        medicine_data = standardize_medicine_data(medicine_data)
+        # 0. 고유 ID 확인 (표준화 전에 계산해 중복 시 표준화 비용 절약)
+        medicine_id = medicine_data.get('id') or generate_medicine_id(medicine_data)
         
         # 1. 중복 검사
-        if is_duplicate_medicine(medicine_data, output_dir):
-            logger.info(f"중복 의약품 스킵: {medicine_data.get('korean_name', '이름 없음')} (ID: {medicine_data.get('id')})")
+        if is_duplicate_medicine_by_id(medicine_id, output_dir):
+            logger.info(f"중복 의약품 스킵: {medicine_data.get('korean_name', '이름 없음')} (ID: {medicine_id})")
             return False, None
         
-        # 2. 고유 ID 확인
-        medicine_id = medicine_data.get('id') or generate_medicine_id(medicine_data)
+        # 2. 데이터 표준화
+        medicine_data = standardize_medicine_data(medicine_data)
         medicine_data["id"] = medicine_id
         
         # 3. JSON 파일로 저장
@@ -229,8 +406,7 @@ def save_medicine_data(medicine_data, json_dir, output_dir):
         # 디렉토리 생성
         os.makedirs(json_dir, exist_ok=True)
         
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(medicine_data, f, ensure_ascii=False, indent=2)
+        _write_json(json_path, medicine_data)
         
         logger.info(f"의약품 데이터 저장 완료: {medicine_name} (ID: {medicine_id})")
         return True, json_path
@@ -245,11 +421,10 @@ def save_medicine_data(medicine_data, json_dir, output_dir):
         
         error_log_path = os.path.join(error_log_dir, f"error_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
         
-        with open(error_log_path, 'w', encoding='utf-8') as f:
-            json.dump({
-                "error": str(e),
-                "medicine_data": medicine_data
-            }, f, ensure_ascii=False, indent=2)
+        _write_json(error_log_path, {
+            "error": str(e),
+            "medicine_data": medicine_data
+        })
         
         return False, None
 
@@ -264,15 +439,13 @@ def load_and_standardize_json(json_path):
         dict: 표준화된 의약품 데이터
     """
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            medicine_data = json.load(f)
+        medicine_data = _read_json(json_path)
         
         # 데이터 표준화
         standardized_data = standardize_medicine_data(medicine_data)
         
         # 파일 업데이트 (표준화된 형식으로)
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(standardized_data, f, ensure_ascii=False, indent=2)
+        _write_json(json_path, standardized_data)
         
         return standardized_data
         
@@ -280,6 +453,18 @@ def load_and_standardize_json(json_path):
         logger.error(f"JSON 파일 로드 중 오류 ({json_path}): {e}")
         return None
 
+def _standardize_one(json_path):
+    """
+    단일 JSON 파일 표준화 (스레드 풀 작업 단위)
+    
+    Args:
+        json_path (str): JSON 파일 경로
+        
+    Returns:
+        tuple: (파일 경로, 성공 여부)
+    """
+    return json_path, load_and_standardize_json(json_path) is not None
+
 def standardize_all_json_files(json_dir):
     """
     디렉토리의 모든 JSON 파일을 표준화
@@ -296,24 +481,46 @@ def standardize_all_json_files(json_dir):
     
     logger.info(f"총 {len(json_files)}개 JSON 파일 표준화 시작...")
     
-    for idx, json_path in enumerate(json_files, 1):
-        try:
-            if load_and_standardize_json(json_path):
-                success_count += 1
-            else:
-                error_count += 1
-                
-            # 진행 상황 보고
-            if idx % 100 == 0 or idx == len(json_files):
-                logger.info(f"JSON 표준화 진행률: {idx}/{len(json_files)} ({idx/len(json_files)*100:.1f}%)")
+    # 파일별로 독립적인 작업이므로 스레드 풀로 병렬 처리
+    # (다중 스레드 수집기에서 fork하면 로깅 잠금/SQLite 연결 등을 물려받으므로 프로세스 풀은 사용하지 않음)
+    try:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(_standardize_one, json_files)
+            
+            for idx, (json_path, ok) in enumerate(results, 1):
+                if ok:
+                    success_count += 1
+                else:
+                    error_count += 1
                 
-        except Exception as e:
-            logger.error(f"파일 표준화 중 오류 ({json_path}): {e}")
-            error_count += 1
+                # 진행 상황 보고
+                if idx % 100 == 0 or idx == len(json_files):
+                    logger.info(f"JSON 표준화 진행률: {idx}/{len(json_files)} ({idx/len(json_files)*100:.1f}%)")
+                    
+    except Exception as e:
+        logger.error(f"파일 표준화 중 오류: {e}")
+        error_count = len(json_files) - success_count
     
     logger.info(f"JSON 파일 표준화 완료: 성공 {success_count}개, 실패 {error_count}개")
     return success_count, error_count
 
+def _csv_cell(data, key):
+    """
+    CSV 셀 값 생성 (누락된 값은 "정보 없음", 큰 텍스트 필드는 문자열일 때만 길이 제한)
+    
+    Args:
+        data (dict): 표준화된 의약품 데이터
+        key (str): 필드명
+        
+    Returns:
+        CSV 셀 값
+    """
+    value = data.get(key) or "정보 없음"
+    if key in _TRUNC_FIELDS and isinstance(value, str) and len(value) > _TRUNC_LENGTH:
+        # 길이가 1000자를 초과하는 경우 요약
+        return value[:_TRUNC_LENGTH - 3] + '...'
+    return value
+
 def export_to_csv(stats, json_dir, output_path, batch_size=500):
     """
     수집된 의약품 데이터를 CSV로 내보내기 (성능 개선 버전)
@@ -331,7 +538,8 @@ def export_to_csv(stats, json_dir, output_path, batch_size=500):
     
     # stats에서 파일 목록 가져오기
     if isinstance(stats, dict) and 'medicine_items' in stats and stats['medicine_items']:
-        json_files = [item['path'] for item in stats['medicine_items'] if os.path.exists(item['path'])]
+        # 존재 여부는 미리 확인하지 않음 (없는 파일은 로드 단계에서 오류 기록 후 건너뜀)
+        json_files = [item['path'] for item in stats['medicine_items']]
     
     # stats에 정보가 없으면 디렉토리에서 직접 검색
     if not json_files:
@@ -345,18 +553,6 @@ def export_to_csv(stats, json_dir, output_path, batch_size=500):
         total_files = len(json_files)
         logger.info(f"CSV 내보내기: 총 {total_files}개 파일 처리 중...")
         
-        # 모든 키 수집 (첫 번째 배치만 샘플링)
-        all_keys = set()
-        sample_size = min(100, total_files)  # 최대 100개 파일만 샘플링
-        
-        for i in range(sample_size):
-            try:
-                with open(json_files[i], 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    all_keys.update(data.keys())
-            except Exception as e:
-                logger.warning(f"키 수집 중 오류 (파일: {json_files[i]}): {e}")
-        
         # CSV 디렉토리 경로 확인 및 생성
         csv_dir = os.path.join(os.path.dirname(os.path.dirname(output_path)), "csv")
         os.makedirs(csv_dir, exist_ok=True)
@@ -364,51 +560,26 @@ def export_to_csv(stats, json_dir, output_path, batch_size=500):
         # 출력 경로 수정 - csv 디렉토리에 저장
         output_path = os.path.join(csv_dir, os.path.basename(output_path))
         
-        # MySQL 친화적인 열 순서 설정
-        # 중요 필드가 먼저 오도록 정렬
-        ordered_keys = [
-            'id', 'korean_name', 'english_name', 'category', 'type', 'company',
-            'classification', 'medicine_type', 'insurance_code', 'approval_number',
-            'components', 'components_amount', 'efficacy', 'dosage', 'precautions', 
-            'side_effects', 'interactions', 'storage', 'expiration',
-            'appearance', 'shape', 'color', 'size', 'identification', 'division_line',
-            'image_url', 'url', 'extracted_time', 'collection_time'
-        ]
-        
-        # 나머지 키는 알파벳 순으로 추가
-        remaining_keys = sorted(list(all_keys - set(ordered_keys)))
-        ordered_keys.extend(remaining_keys)
-        
-        # 배치 처리로 CSV 파일 작성
-        with open(output_path, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=ordered_keys)
-            writer.writeheader()
+        # 표준화된 데이터는 MEDICINE_FIELDS 키만 가지므로 열 순서는 고정
+        ordered_keys = _CSV_COLUMNS
+        
+        # 배치 처리로 CSV 파일 작성 (JSON 로드/표준화는 스레드 풀, CSV 쓰기는 현재 스레드)
+        with open(output_path, 'w', encoding='utf-8', newline='') as f, \
+                ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            writer = csv.writer(f)
+            writer.writerow(ordered_keys)
             
             # 배치 단위로 처리
             for i in range(0, total_files, batch_size):
                 batch_files = json_files[i:i+batch_size]
-                batch_data = []
-                
-                for json_file in batch_files:
-                    try:
-                        medicine_data = load_and_standardize_json(json_file)
-                        if medicine_data:
-                            batch_data.append(medicine_data)
-                    except Exception as e:
-                        logger.warning(f"JSON 파일 로드 중 오류 (파일: {json_file}): {e}")
                 
-                # 불필요한 큰 텍스트 필드 요약 (메모리 효율성)
-                for data in batch_data:
-                    for field in ['components', 'efficacy', 'precautions', 'dosage']:
-                        if field in data and isinstance(data[field], str) and len(data[field]) > 1000:
-                            # 길이가 1000자를 초과하는 경우 요약
-                            data[field] = data[field][:997] + '...'
+                # 로드 실패한 파일(None)은 load_and_standardize_json에서 기록 후 제외
+                batch_data = [data for data in executor.map(load_and_standardize_json, batch_files) if data]
                 
-                # 배치 데이터 쓰기
-                for data in batch_data:
-                    # 누락된 필드는 "정보 없음"으로 처리
-                    row_data = {k: (data.get(k, "정보 없음") if data.get(k) else "정보 없음") for k in ordered_keys}
-                    writer.writerow(row_data)
+                # 배치 데이터 쓰기 (누락된 필드는 "정보 없음"으로 처리)
+                # 큰 텍스트 필드는 CSV 행에서만 1000자로 요약 (JSON 원본은 그대로 유지)
+                rows = [[_csv_cell(data, k) for k in ordered_keys] for data in batch_data]
+                writer.writerows(rows)
                 
                 # 메모리 확보를 위해 배치 데이터 해제
                 batch_data = None
@@ -5,12 +5,160 @@ HTML 보고서 생성
 """
 
 import os
+import atexit
 import logging
+import threading
+from collections import defaultdict
 from datetime import datetime
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 의약품 항목 HTML 템플릿 (str.format_map으로 한 번에 렌더링)
+_ITEM_TEMPLATE = """
+        <div class="medicine-item">
+            <h3>{korean_name}</h3>
+            <div class="medicine-info">
+    
+                <div class="info-group">
+                    <div><span class="info-label">ID:</span> <span class="info-value">{id}</span></div>
+                    <div><span class="info-label">영문명:</span> <span class="info-value">{english_name}</span></div>
+                    <div><span class="info-label">제조사:</span> <span class="info-value">{company}</span></div>
+                    <div><span class="info-label">분류:</span> <span class="info-value">{category}</span></div>
+                    <div><span class="info-label">보험코드:</span> <span class="info-value">{insurance_code}</span></div>
+                </div>
+    
+                <div class="info-group">
+                    <div><span class="info-label">성상:</span> <span class="info-value">{appearance}</span></div>
+                    <div><span class="info-label">모양:</span> <span class="info-value">{shape}</span></div>
+                    <div><span class="info-label">색깔:</span> <span class="info-value">{color}</span></div>
+                    <div><span class="info-label">크기:</span> <span class="info-value">{size}</span></div>
+                    <div><span class="info-label">식별표기:</span> <span class="info-value">{identification}</span></div>
+    
+                    <div><span class="info-label">분할선:</span> <span class="info-value">{division_info_text}</span></div>
+                </div>
+    
+                <div class="info-group">
+{completeness}
+                </div>
+    
+            </div>
+        </div>
+        <div class="medicine-separator"></div>
+    """
+
+# 데이터 완성도 표시 필드와 라벨
+_HTML_FLAGS = ('components', 'efficacy', 'dosage', 'precautions', 'image_url')
+_HTML_FLAG_LABELS = {
+    'components': '성분정보',
+    'efficacy': '효능효과',
+    'dosage': '용법용량',
+    'precautions': '주의사항',
+    'image_url': '이미지',
+}
+
+class HtmlReport:
+    """
+    열린 파일 핸들을 유지하는 HTML 보고서
+    - 항목마다 파일을 다시 열지 않고 하나의 핸들에 기록
+    - 기록할 때마다 flush하므로 중단되더라도 이미 추가된 항목은 유지됨
+    """
+    
+    def __init__(self, path, mode='a'):
+        self.path = path
+        self._handle = open(path, mode, encoding='utf-8')
+        self._lock = threading.Lock()
+        self.closed = False
+    
+    def write(self, text):
+        """
+        보고서에 텍스트 기록
+        
+        Returns:
+            bool: 기록 여부 (이미 닫힌 보고서면 False)
+        """
+        with self._lock:
+            if self.closed:
+                return False
+            self._handle.write(text)
+            self._handle.flush()
+            return True
+    
+    def close(self, footer=None):
+        """마무리 텍스트(있으면) 기록 후 파일 핸들 닫기 - 닫힌 뒤의 기록은 무시됨"""
+        with self._lock:
+            if self.closed:
+                return
+            if footer:
+                self._handle.write(footer)
+            self._handle.close()
+            self.closed = True
+
+# 경로별로 열려 있는 보고서
+_open_reports = {}
+_open_reports_lock = threading.Lock()
+
+# 마무리된 보고서 경로 (다시 열어 </html> 뒤에 기록하지 않도록 유지)
+_finalized_reports = set()
+
+# 보고서 번호 발급 잠금
+_counter_lock = threading.Lock()
+
+def _get_report(html_file):
+    """
+    경로에 해당하는 열린 보고서 반환 (없으면 추가 모드로 열기)
+    
+    Args:
+        html_file (str): HTML 파일 경로
+        
+    Returns:
+        HtmlReport: 보고서 객체 (이미 마무리된 보고서면 None)
+    """
+    with _open_reports_lock:
+        if html_file in _finalized_reports:
+            return None
+        report = _open_reports.get(html_file)
+        if report is None:
+            report = HtmlReport(html_file)
+            _open_reports[html_file] = report
+        return report
+
+@atexit.register
+def _close_open_reports():
+    """종료 시 열려 있는 보고서 핸들 닫기 (마무리 태그는 추가하지 않음)"""
+    with _open_reports_lock:
+        reports = list(_open_reports.values())
+        _open_reports.clear()
+    for report in reports:
+        report.close()
+
+def _next_report_number(html_dir):
+    """
+    다음 보고서 번호 발급 (.report_counter 파일에 마지막 번호 저장)
+    
+    Args:
+        html_dir (str): HTML 파일 저장 디렉토리
+        
+    Returns:
+        int: 보고서 번호
+    """
+    counter_path = os.path.join(html_dir, '.report_counter')
+    
+    with _counter_lock:
+        try:
+            with open(counter_path, 'r', encoding='utf-8') as f:
+                last_num = int(f.read().strip())
+        except (FileNotFoundError, ValueError):
+            # 카운터가 없으면 기존 보고서 수로 1회 초기화
+            last_num = len([f for f in os.listdir(html_dir)
+                            if f.startswith('medicine_report_') and f.endswith('.html')])
+        
+        report_num = last_num + 1
+        with open(counter_path, 'w', encoding='utf-8') as f:
+            f.write(str(report_num))
+    
+    return report_num
+
 def init_html_report(html_dir):
     """
     HTML 보고서 파일 초기화
@@ -22,8 +170,7 @@ def init_html_report(html_dir):
         str: 생성된 HTML 파일 경로
     """
     # 현재 HTML 파일 번호 계산
-    html_files = [f for f in os.listdir(html_dir) if f.startswith('medicine_report_') and f.endswith('.html')]
-    report_num = len(html_files) + 1
+    report_num = _next_report_number(html_dir)
     
     # 파일명 생성
     html_filename = f"medicine_report_{report_num:03d}.html"
@@ -76,9 +223,12 @@ def init_html_report(html_dir):
     <div id="medicine-list">
 """
     
-    # 파일 저장
-    with open(html_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # 파일 생성 후 핸들 유지
+    report = HtmlReport(html_path, 'w')
+    report.write(html_content)
+    with _open_reports_lock:
+        _finalized_reports.discard(html_path)
+        _open_reports[html_path] = report
     
     logger.info(f"HTML 보고서 초기화 완료: {html_path}")
     
@@ -94,71 +244,36 @@ def add_to_html_report(medicine_data, html_file, item_count):
         item_count (int): 현재 항목 카운터
         
     Returns:
-        int: 업데이트된 항목 카운터
+        int: 업데이트된 항목 카운터 (이미 마무리된 보고서면 변경하지 않음)
     """
     if html_file is None:
         return item_count
     
-    # 의약품 데이터를 HTML로 변환
-    html_item = """
-        <div class="medicine-item">
-            <h3>""" + medicine_data.get('korean_name', '이름 없음') + """</h3>
-            <div class="medicine-info">
-    """
-    
-    # 기본 정보 그룹
-    html_item += """
-                <div class="info-group">
-                    <div><span class="info-label">ID:</span> <span class="info-value">""" + medicine_data.get('id', '') + """</span></div>
-                    <div><span class="info-label">영문명:</span> <span class="info-value">""" + medicine_data.get('english_name', '정보 없음') + """</span></div>
-                    <div><span class="info-label">제조사:</span> <span class="info-value">""" + medicine_data.get('company', '정보 없음') + """</span></div>
-                    <div><span class="info-label">분류:</span> <span class="info-value">""" + medicine_data.get('category', '정보 없음') + """</span></div>
-                    <div><span class="info-label">보험코드:</span> <span class="info-value">""" + medicine_data.get('insurance_code', '정보 없음') + """</span></div>
-                </div>
-    """
+    # 템플릿 값 구성 (누락된 필드는 "정보 없음")
+    values = defaultdict(lambda: '정보 없음', medicine_data)
+    values['korean_name'] = medicine_data.get('korean_name', '이름 없음')
+    values['id'] = medicine_data.get('id', '')
     
-    # 외형 정보 그룹
-    html_item += """
-                <div class="info-group">
-                    <div><span class="info-label">성상:</span> <span class="info-value">""" + medicine_data.get('appearance', '정보 없음') + """</span></div>
-                    <div><span class="info-label">모양:</span> <span class="info-value">""" + medicine_data.get('shape', '정보 없음') + """</span></div>
-                    <div><span class="info-label">색깔:</span> <span class="info-value">""" + medicine_data.get('color', '정보 없음') + """</span></div>
-                    <div><span class="info-label">크기:</span> <span class="info-value">""" + medicine_data.get('size', '정보 없음') + """</span></div>
-                    <div><span class="info-label">식별표기:</span> <span class="info-value">""" + medicine_data.get('identification', '정보 없음') + """</span></div>
-    """
-
     # 분할선 정보 추가
     division_info_text = "정보 없음"
     if "division_info" in medicine_data and medicine_data["division_info"]:
         if isinstance(medicine_data["division_info"], dict) and "division_description" in medicine_data["division_info"]:
             division_info_text = medicine_data["division_info"]["division_description"] or "정보 없음"
+    values['division_info_text'] = division_info_text
     
-    html_item += """
-                    <div><span class="info-label">분할선:</span> <span class="info-value">""" + division_info_text + """</span></div>
-                </div>
-    """
-    
-    # 데이터 완성도 그룹
-    html_item += """
-                <div class="info-group">
-                    <div><span class="info-label">성분정보:</span> <span class="info-value """ + ('exists' if 'components' in medicine_data and medicine_data['components'] else 'missing') + """">""" + ('있음' if 'components' in medicine_data and medicine_data['components'] else '없음') + """</span></div>
-                    <div><span class="info-label">효능효과:</span> <span class="info-value """ + ('exists' if 'efficacy' in medicine_data and medicine_data['efficacy'] else 'missing') + """">""" + ('있음' if 'efficacy' in medicine_data and medicine_data['efficacy'] else '없음') + """</span></div>
-                    <div><span class="info-label">용법용량:</span> <span class="info-value """ + ('exists' if 'dosage' in medicine_data and medicine_data['dosage'] else 'missing') + """">""" + ('있음' if 'dosage' in medicine_data and medicine_data['dosage'] else '없음') + """</span></div>
-                    <div><span class="info-label">주의사항:</span> <span class="info-value """ + ('exists' if 'precautions' in medicine_data and medicine_data['precautions'] else 'missing') + """">""" + ('있음' if 'precautions' in medicine_data and medicine_data['precautions'] else '없음') + """</span></div>
-                    <div><span class="info-label">이미지:</span> <span class="info-value """ + ('exists' if 'image_url' in medicine_data and medicine_data['image_url'] else 'missing') + """">""" + ('있음' if 'image_url' in medicine_data and medicine_data['image_url'] else '없음') + """</span></div>
-                </div>
-    """
-    
-    # 항목 마무리
-    html_item += """
-            </div>
-        </div>
-        <div class="medicine-separator"></div>
-    """
+    # 데이터 완성도 표시
+    present = frozenset(field for field in _HTML_FLAGS if medicine_data.get(field))
+    values['completeness'] = '\n'.join(
+        f'                    <div><span class="info-label">{_HTML_FLAG_LABELS[field]}:</span> '
+        f'<span class="info-value {"exists" if field in present else "missing"}">{"있음" if field in present else "없음"}</span></div>'
+        for field in _HTML_FLAGS
+    )
     
-    # HTML 파일에 항목 추가
-    with open(html_file, 'a', encoding='utf-8') as f:
-        f.write(html_item)
+    # HTML 파일에 항목 추가 (이미 마무리된 보고서에는 추가하지 않음)
+    report = _get_report(html_file)
+    if report is None or not report.write(_ITEM_TEMPLATE.format_map(values)):
+        logger.warning(f"마무리된 HTML 보고서에는 항목을 추가하지 않습니다: {html_file}")
+        return item_count
     
     # 항목 카운터 증가
     item_count += 1
@@ -175,9 +290,17 @@ def finalize_html_report(html_file):
     if html_file is None:
         return
     
-    # HTML 마무리 태그 추가
-    with open(html_file, 'a', encoding='utf-8') as f:
-        f.write("""
+    # 이미 마무리된 보고서는 다시 열지 않음
+    report = _get_report(html_file)
+    if report is None:
+        return
+    
+    with _open_reports_lock:
+        _finalized_reports.add(html_file)
+        _open_reports.pop(html_file, None)
+    
+    # HTML 마무리 태그 추가 후 핸들 닫기
+    report.close("""
     </div>
     <div class="timestamp">완료 시간: """ + datetime.now().strftime('%Y-%m-%d %H:%M:%S') + """</div>
 </body>
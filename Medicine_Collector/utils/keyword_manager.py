@@ -6,20 +6,139 @@
 
 import os
 import re
+import sys
 import json
-import glob
+import mmap
+import atexit
+import time
 import logging
 import random
+import threading
+import multiprocessing
+from collections import Counter
+from contextlib import nullcontext
+from functools import lru_cache
+from itertools import chain, islice
+from concurrent.futures import ProcessPoolExecutor
 from tqdm import tqdm
 
-# 로거 설정
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+# 로거 설정 (핸들러는 실행 진입점의 logging 설정을 사용 - 별도 추가 시 로그가 중복 출력됨)
 logger = logging.getLogger(__name__)
-# 콘솔 로그 추가
-console_handler = logging.StreamHandler()
-logger.addHandler(console_handler)
 logger.setLevel(logging.INFO)
 
+# 정규화 패턴
+_PAREN_RE = re.compile(r'\([^)]*\)')
+_NORM_UNIT_RE = re.compile(r'\d+(?:\.\d+)?(?:mg|ml|g|mcg|μg|%|정|캡슐|시럽|주|액|/\w+)')
+_JUNG_AFFIX_RE = re.compile(r'^중\s*|\s*중$')
+_AFFIX_TERMS = ('내수용', '수출용', '바이알', '각', '이상')
+_AFFIX_RES = tuple(re.compile(f'^{term}\\s*|\\s*{term}$') for term in _AFFIX_TERMS)
+# 유니코드 \w 대신 명시적 범위 사용 (영문/숫자/밑줄/한글 음절 외 문자 제거)
+_SPECIAL_CHAR_RE = re.compile(r'[^A-Za-z0-9_\s가-힣]')
+# 정규화가 필요 없는 키워드 판별용: 숫자, 괄호, 특수문자 중 하나라도 있으면 일치
+_NEEDS_NORMALIZE_RE = re.compile(r'[^A-Za-z_\s가-힣]')
+_ALL_AFFIX_TERMS = ('중',) + _AFFIX_TERMS
+
+# JSON 필드 키워드 추출 패턴
+_CLASS_CODE_RE = re.compile(r'\[([^\]]+)\]([^,\[]+)')
+_CLASS_SPLIT_RE = re.compile(r'[/>.]')
+_BRACKET_RE = re.compile(r'\[[^\]]*\]')
+_LIST_SPLIT_RE = re.compile(r'[/,]')
+_COMPANY_PART_RE = re.compile(r'([가-힣A-Za-z]{2,})')
+_COLOR_RES = (
+    re.compile(r'(흰색|백색|노란색|노랑|황색|주황색|빨간색|적색|분홍색|핑크색|보라색|자주색|파란색|청색|녹색|초록색|갈색|회색|검정색|투명)'),
+    re.compile(r'([가-힣]+(?:색|빛))'),
+)
+_SHAPE_RES = (
+    re.compile(r'(정제|캡슐|시럽|액제|주사제|연고|크림|겔|좌제|산제|과립제|트로키|패치|스프레이)'),
+    re.compile(r'([가-힣]+(?:형|모양))'),
+)
+
+# JSON 필드 매핑 (원래 JSON 필드명: 표준화된 필드명)
+_KEYWORD_FIELD_MAPPING = {
+    'classification': 'classification',  # 분류
+    'category': 'category',              # 구분
+    'category_name': 'category', 
+    'company': 'company',                # 업체명
+    'company_name': 'company',
+    'appearance': 'appearance',          # 성상
+    'shape_type': 'shape_type',          # 제형
+    'shape_info': 'shape_type'
+}
+# 업체명에서 제외할 일반 단어
+_COMPANY_COMMON_WORDS = frozenset(['주식회사', '제약', '약품', '바이오', '팜', '케미칼'])
+
+# 이 개수 미만의 JSON 파일은 프로세스 풀 시작 비용이 더 크므로 현재 프로세스에서 추출
+_PARALLEL_EXTRACT_MIN_FILES = 64
+
+# 키워드 후보 필터 패턴
+_DOSE_UNIT_RE = re.compile(r'\d+\s*(?:mg|ml|g|mcg|μg|%|정|캡슐)')
+_DISALLOWED_CHAR_RE = re.compile(r'[^\w\s가-힣.-]')
+
+# 일반 의약품명 판별 패턴
+_INVALID_KEYWORD_RE = re.compile(
+    r'^(?:중\s*|\s*중|mg\s*|\s*mg|g\s*|\s*g|ml\s*|\s*ml|각\s*|\s*각|및\s*|\s*및'
+    r'|염산|황산|ml 중|mL 중|L 중)$'
+)
+_SINGLE_CHAR_KEYWORDS = frozenset(['L', 'A', 'B', 'C', 'E', 'g', 'l', 'p', 'd'])
+# isalnum()이 아니고 공백/하이픈도 아닌 문자 (\w에 포함되는 밑줄도 특수문자로 취급)
+_GENERIC_SPECIAL_CHAR_RE = re.compile(r'[^\w -]|_')
+_DOSAGE_FORM_RE = re.compile('정|캡슐|시럽|주|액|크림|겔|로션')
+_COMMON_COMPONENT_SUFFIXES = (
+    '염산염', '황산염', '말레산염', '타르타르산염', '수화물', '질산염', 
+    '아세트산염', '시트르산염', '포스페이트', '베실산염', '글루콘산염'
+)
+
+# 초기 키워드 목록 (호출마다 새로 만들지 않도록 모듈 상수로 유지)
+_INITIAL_KEYWORDS = (
+    "타이레놀", "게보린", "아스피린", "부루펜", "판피린", "판콜", 
+    "텐텐", "이가탄", "베아제", "훼스탈", "백초시럽", "판콜에이", 
+    "신신파스", "포카시엘", "우루사", "인사돌", "센트럼", "삐콤씨", 
+    "컨디션", "박카스", "아로나민", "아모잘탄", "엔테론", "듀파락"
+)
+
+# 키워드가 없을 때 생성할 핵심 키워드 (검색 확률이 높은 주요 일반의약품만 선택)
+_CORE_INITIAL_KEYWORDS = (
+    "타이레놀", "게보린", "판콜", "부루펜", "판피린", 
+    "우루사", "훼스탈", "아로나민", "베아제", "컨디션"
+)
+
+# 확장된 초기 키워드 목록 - 더 다양한 의약품 분류와 일반 의약품 포함
+_EXTENSIVE_INITIAL_KEYWORDS = frozenset([
+    # 일반 의약품 분류
+    "진통제", "해열제", "감기약", "소화제", "제산제", "지사제", "변비약", 
+    "비타민", "종합비타민", "구충제", "항히스타민제", "항생제", "소염진통제",
+    
+    # 처방약 분류
+    "고혈압약", "당뇨약", "콜레스테롤약", "항응고제", "항우울제", "항불안제",
+    "수면제", "갑상선약", "관절염약", "천식약", "간질약", "빈혈약",
+    
+    # 의약품 투여 형태
+    "정제", "캡슐", "주사제", "연고", "크림", "점안액", "점이액", 
+    "좌제", "시럽", "패치", "겔", "스프레이",
+    
+    # 다빈도 일반의약품 브랜드
+    "타이레놀", "게보린", "판콜", "베아제", "인사돌", "텐텐", "판피린",
+    "부루펜", "아스피린", "판콜에이", "신신파스", "이가탄", "훼스탈", 
+    "백초시럽", "센트룸", "삐콤씨", "컨디션", "박카스", "라니티딘",
+    
+    # 다빈도 처방약 성분
+    "아목시실린", "세티리진", "로라타딘", "디클로페낙", "메트포민",
+    "심바스타틴", "아토르바스타틴", "암로디핀", "오메프라졸", "라니티딘",
+    "독시사이클린", "세파클러", "아세트아미노펜", "이부프로펜", "리도카인",
+    
+    # 일반 의약품 효능군
+    "두통약", "치통약", "생리통약", "근육통약", "관절통약", "소화촉진제",
+    "비염약", "기침약", "가래약", "멀미약", "숙취해소제", "알레르기약",
+    "피부연고", "습포제", "구내염약", "안약", "피로회복제", "변비약"
+])
+
 # 1. 키워드 정규화 함수 개선 (기존 normalize_keyword 대체)
+@lru_cache(maxsize=16384)
 def normalize_keyword(keyword):
     """
     키워드 정규화 - 개선된 버전
@@ -36,25 +155,330 @@ def normalize_keyword(keyword):
     # 1. 공백 제거
     norm_keyword = keyword.strip()
     
+    # 숫자/괄호/특수문자/접두사/접미사가 없으면 아래 치환이 모두 무의미하므로 바로 반환
+    if (not _NEEDS_NORMALIZE_RE.search(norm_keyword)
+            and not norm_keyword.startswith(_ALL_AFFIX_TERMS)
+            and not norm_keyword.endswith(_ALL_AFFIX_TERMS)):
+        return norm_keyword
+    
     # 2. 괄호 및 괄호 내용 제거
-    norm_keyword = re.sub(r'\([^)]*\)', '', norm_keyword).strip()
+    norm_keyword = _PAREN_RE.sub('', norm_keyword).strip()
     
     # 3. 숫자와 단위 제거 (확장된 패턴)
-    norm_keyword = re.sub(r'\d+(\.\d+)?(mg|ml|g|mcg|μg|%|정|캡슐|시럽|주|액|/\w+)', '', norm_keyword)
+    norm_keyword = _NORM_UNIT_RE.sub('', norm_keyword)
     
     # 4. '중' 접두사/접미사 제거
-    norm_keyword = re.sub(r'^중\s*|\s*중$', '', norm_keyword)
+    norm_keyword = _JUNG_AFFIX_RE.sub('', norm_keyword)
     
     # 5. 일반적인 접두사/접미사 제거
-    prefixes_suffixes = ['내수용', '수출용', '바이알', '각', '이상']
-    for term in prefixes_suffixes:
-        norm_keyword = re.sub(f'^{term}\\s*|\\s*{term}$', '', norm_keyword)
+    for affix_re in _AFFIX_RES:
+        norm_keyword = affix_re.sub('', norm_keyword)
     
     # 6. 기타 특수문자 제거
-    norm_keyword = re.sub(r'[^\w\s가-힣]', '', norm_keyword).strip()
+    norm_keyword = _SPECIAL_CHAR_RE.sub('', norm_keyword).strip()
     
     return norm_keyword
 
+def _load_json_file(path):
+    """
+    JSON 파일 로드 (orjson 사용 가능 시 바이트 단위로 파싱)
+    
+    Args:
+        path (str): 파일 경로
+        
+    Returns:
+        JSON 데이터
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# 이 크기를 넘는 키워드 파일은 mmap으로 읽음
+_MMAP_MIN_BYTES = 64 * 1024
+
+def _read_keyword_lines(path):
+    """
+    키워드 파일의 비어 있지 않은 줄 목록 로드 (같은 키워드는 하나의 문자열 객체로 intern)
+    큰 파일은 mmap 버퍼에서 바로 디코딩해 중간 bytes 복사본을 만들지 않음
+    
+    Args:
+        path (str): 키워드 파일 경로
+        
+    Returns:
+        list: 키워드 목록 (파일 순서, 중복 포함)
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                lines = str(mm, 'utf-8').splitlines()
+        else:
+            lines = f.read().decode('utf-8').splitlines()
+    return [sys.intern(s) for s in map(str.strip, lines) if s]
+
+def _write_keyword_lines(path, keywords):
+    """
+    키워드 목록을 파일에 기록 (줄 단위, 마지막 줄도 개행으로 종료)
+    전체 내용을 한 번에 UTF-8로 인코딩해 임시 파일에 기록한 뒤 교체 (중단 시에도 파일이 잘리지 않음)
+    
+    Args:
+        path (str): 키워드 파일 경로
+        keywords (iterable): 키워드 목록
+    """
+    blob = ''.join(f"{keyword}\n" for keyword in keywords).encode('utf-8')
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(blob)
+    os.replace(tmp_path, path)
+
+def _append_keyword_lines(path, keywords):
+    """
+    키워드 목록을 파일 끝에 추가 (기존 마지막 줄이 개행으로 끝나지 않으면 개행부터 추가)
+    
+    Args:
+        path (str): 키워드 파일 경로
+        keywords (iterable): 추가할 키워드 목록
+    """
+    blob = ''.join(f"{keyword}\n" for keyword in keywords).encode('utf-8')
+    with open(path, 'a+b') as f:
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                blob = b'\n' + blob
+        f.write(blob)
+
+def _file_signature(path):
+    """
+    파일 변경 감지용 (inode, mtime, ctime, size), 파일이 없으면 None
+    mtime 해상도 안에서 같은 크기로 다시 기록된 경우도 inode(교체) 또는 ctime(제자리 기록) 변화로 감지
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size
+
+class KeywordStore:
+    """
+    keywords_todo.txt / keywords_done.txt 메모리 캐시
+    - 파일은 변경(inode, mtime, ctime, 크기)된 경우에만 다시 읽음
+    - 완료 처리는 O(1): todo에서 제거, done에 추가
+    - done 파일 추가는 DONE_BATCH_SIZE개 또는 DONE_FLUSH_INTERVAL초마다 한 번에 기록
+      (강제 종료 시 아직 기록하지 않은 완료 키워드는 유실되어 재시작 후 다시 검색되므로,
+      수집기는 체크포인트/보고서 마무리 시점마다 flush_done()으로 기록함)
+    - todo에서 제거된 키워드는 tombstone으로 표시해 두고, TODO_COMPACT_INTERVAL개가
+      쌓이거나 flush()/프로세스 종료 시에만 todo 파일을 다시 기록
+    """
+    
+    DONE_BATCH_SIZE = 32
+    DONE_FLUSH_INTERVAL = 5.0
+    TODO_COMPACT_INTERVAL = 100
+    
+    def __init__(self, output_dir):
+        keywords_dir = os.path.join(output_dir, "keywords")
+        os.makedirs(keywords_dir, exist_ok=True)
+        
+        self.todo_path = os.path.join(keywords_dir, "keywords_todo.txt")
+        self.done_path = os.path.join(keywords_dir, "keywords_done.txt")
+        
+        self.todo = {}                # 처리 예정 키워드 (순서 유지 집합으로 dict 사용)
+        self.done = set()             # 처리 완료 키워드
+        self.todo_line_count = 0      # 마지막으로 읽은 todo 파일의 키워드 줄 수 (중복 포함)
+        self.todo_exists = False
+        
+        self._todo_signature = None
+        self._done_signature = None
+        self._removed = set()         # todo 파일에 아직 반영되지 않은 완료 키워드
+        self._pending_done = []       # done 파일에 아직 기록하지 않은 완료 키워드
+        self._last_done_flush = time.monotonic()
+        self._lock = threading.RLock()
+        
+        self.reload_if_changed()
+    
+    def reload_if_changed(self):
+        """파일이 변경되었으면 다시 로드"""
+        with self._lock:
+            done_signature = _file_signature(self.done_path)
+            if done_signature != self._done_signature:
+                self.done = set(_read_keyword_lines(self.done_path)) if done_signature else set()
+                self.done.update(self._pending_done)
+                self._done_signature = done_signature
+            
+            todo_signature = _file_signature(self.todo_path)
+            if todo_signature != self._todo_signature:
+                todo_keywords = _read_keyword_lines(self.todo_path) if todo_signature else []
+                self.todo_line_count = len(todo_keywords)
+                # 순서 유지 중복 제거 (외부에서 파일이 바뀌었어도 아직 기록하지 않은 완료 처리는 유지)
+                self.todo = dict.fromkeys(todo_keywords)
+                for keyword in self._removed:
+                    self.todo.pop(keyword, None)
+                self.todo_exists = todo_signature is not None or bool(self._removed)
+                self._todo_signature = todo_signature
+    
+    def replace_todo(self, keywords):
+        """todo 목록 전체 교체 후 파일에 기록"""
+        with self._lock:
+            self.todo = dict.fromkeys(keywords)
+            _write_keyword_lines(self.todo_path, self.todo)
+            self.todo_line_count = len(self.todo)
+            self.todo_exists = True
+            self._removed.clear()
+            self._todo_signature = _file_signature(self.todo_path)
+    
+    def append_todo(self, keywords):
+        """todo에 없는 새 키워드만 파일 끝에 추가 (전체 파일을 다시 기록하지 않음)"""
+        with self._lock:
+            new_keywords = [keyword for keyword in dict.fromkeys(keywords) if keyword not in self.todo]
+            if new_keywords:
+                _append_keyword_lines(self.todo_path, new_keywords)
+                self.todo.update(dict.fromkeys(new_keywords))
+                self.todo_line_count += len(new_keywords)
+                self.todo_exists = True
+                self._todo_signature = _file_signature(self.todo_path)
+            return new_keywords
+    
+    def mark_done(self, keyword):
+        """
+        키워드 완료 처리
+        
+        Returns:
+            bool: todo 목록에 있던 키워드인지 여부
+        """
+        with self._lock:
+            keyword = sys.intern(keyword)
+            in_todo = keyword in self.todo
+            if in_todo:
+                del self.todo[keyword]
+                self._removed.add(keyword)
+            
+            if keyword not in self.done:
+                self.done.add(keyword)
+                self._pending_done.append(keyword)
+                if (len(self._pending_done) >= self.DONE_BATCH_SIZE or
+                        time.monotonic() - self._last_done_flush >= self.DONE_FLUSH_INTERVAL):
+                    self._flush_done()
+            
+            if len(self._removed) >= self.TODO_COMPACT_INTERVAL:
+                self._flush_todo()
+            
+            return in_todo
+    
+    def mark_done_many(self, keywords):
+        """
+        여러 키워드를 한 번에 완료 처리 (done 파일 추가와 todo 재기록은 최대 한 번)
+        
+        Args:
+            keywords (iterable): 완료된 키워드 목록
+            
+        Returns:
+            int: todo 목록에서 제거된 키워드 수
+        """
+        with self._lock:
+            completed = dict.fromkeys(map(sys.intern, filter(None, keywords)))
+            removed_count = 0
+            for keyword in completed:
+                if keyword in self.todo:
+                    del self.todo[keyword]
+                    self._removed.add(keyword)
+                    removed_count += 1
+            
+            new_done = [keyword for keyword in completed if keyword not in self.done]
+            self.done.update(new_done)
+            self._pending_done.extend(new_done)
+            self._flush_done()
+            
+            if len(self._removed) >= self.TODO_COMPACT_INTERVAL:
+                self._flush_todo()
+            
+            return removed_count
+    
+    def _flush_done(self):
+        """대기 중인 완료 키워드를 done 파일에 한 번에 추가"""
+        if self._pending_done:
+            _append_keyword_lines(self.done_path, self._pending_done)
+            self._pending_done.clear()
+            self._done_signature = _file_signature(self.done_path)
+        self._last_done_flush = time.monotonic()
+    
+    def flush_done(self):
+        """대기 중인 완료 키워드만 done 파일에 기록 (todo 파일은 다시 기록하지 않음)"""
+        with self._lock:
+            self._flush_done()
+    
+    def _flush_todo(self):
+        """tombstone 처리된 키워드를 제외하고 todo 파일을 다시 기록"""
+        if self._removed:
+            # 중단되더라도 키워드가 유실되지 않도록 done 기록을 먼저 반영
+            self._flush_done()
+            self.reload_if_changed()
+            self.replace_todo(list(self.todo))
+    
+    def flush(self):
+        """아직 기록하지 않은 done/todo 변경사항을 파일에 기록"""
+        with self._lock:
+            self._flush_done()
+            self._flush_todo()
+
+# output_dir별 키워드 저장소
+_keyword_stores = {}
+_keyword_stores_lock = threading.Lock()
+
+# 저장소를 소유한 프로세스 (자식 프로세스에서는 종료 시 기록하지 않음)
+_OWNER_PID = os.getpid()
+
+def _get_keyword_store(output_dir):
+    """
+    output_dir에 해당하는 키워드 저장소 반환 (파일 변경 시 다시 로드)
+    
+    Args:
+        output_dir (str): 출력 디렉토리
+        
+    Returns:
+        KeywordStore: 키워드 저장소
+    """
+    key = os.path.abspath(output_dir)
+    with _keyword_stores_lock:
+        store = _keyword_stores.get(key)
+        if store is None:
+            store = KeywordStore(output_dir)
+            _keyword_stores[key] = store
+        else:
+            store.reload_if_changed()
+        return store
+
+def flush_keyword_progress(output_dir):
+    """
+    메모리에 대기 중인 키워드 진행 상황을 파일에 기록
+    
+    Args:
+        output_dir (str): 출력 디렉토리
+    """
+    _get_keyword_store(output_dir).flush()
+
+def flush_completed_keywords(output_dir):
+    """
+    메모리에 대기 중인 완료 키워드를 done 파일에 기록 (체크포인트 저장 시 사용)
+    
+    Args:
+        output_dir (str): 출력 디렉토리
+    """
+    _get_keyword_store(output_dir).flush_done()
+
+@atexit.register
+def _flush_keyword_stores():
+    """종료 시 모든 키워드 저장소의 변경사항 기록"""
+    if os.getpid() != _OWNER_PID:
+        return
+    
+    with _keyword_stores_lock:
+        for store in _keyword_stores.values():
+            try:
+                store.flush()
+            except Exception as e:
+                logger.error(f"키워드 파일 기록 중 오류: {e}")
+
 def load_keywords(output_dir):
     """
     키워드 파일 로드 - 중복 제거 기능 추가
@@ -65,50 +489,27 @@ def load_keywords(output_dir):
     Returns:
         list: 키워드 목록
     """
-    # 키워드 디렉토리 경로 변경
-    keywords_dir = os.path.join(output_dir, "keywords")
-    os.makedirs(keywords_dir, exist_ok=True)
-    
-    todo_path = os.path.join(keywords_dir, "keywords_todo.txt")
-    done_path = os.path.join(keywords_dir, "keywords_done.txt")
-    
-    # done 키워드 로드 (이미 처리된 키워드)
-    done_keywords = set()
-    if os.path.exists(done_path):
-        with open(done_path, 'r', encoding='utf-8') as f:
-            done_keywords = {line.strip() for line in f if line.strip()}
-        logger.info(f"이미 처리된 키워드: {len(done_keywords)}개")
+    store = _get_keyword_store(output_dir)
+    done_keywords = store.done
+    if done_keywords:
+        logger.info("이미 처리된 키워드: %d개", len(done_keywords))
 
     # todo 키워드 파일이 없으면 초기 키워드 생성
-    if not os.path.exists(todo_path):
-        initial_keywords = generate_initial_keywords()
-        
+    if not store.todo_exists:
         # 이미 처리된 키워드 제외
-        initial_keywords = [kw for kw in initial_keywords if kw not in done_keywords]
+        initial_keywords = [kw for kw in _INITIAL_KEYWORDS if kw not in done_keywords]
         
-        with open(todo_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(initial_keywords))
+        store.replace_todo(initial_keywords)
         logger.info(f"초기 키워드 생성 완료: {len(initial_keywords)}개")
         return initial_keywords
 
-    # 기존 todo 키워드 로드 및 중복 제거
-    with open(todo_path, 'r', encoding='utf-8') as f:
-        todo_keywords = [line.strip() for line in f if line.strip()]
-    
-    # 중복 제거 및 이미 처리된 키워드 제외
-    unique_todo_keywords = []
-    seen = set()
-    
-    for keyword in todo_keywords:
-        if keyword and keyword not in seen and keyword not in done_keywords:
-            unique_todo_keywords.append(keyword)
-            seen.add(keyword)
+    # 중복 제거(저장소에서 처리됨) 및 이미 처리된 키워드 제외
+    unique_todo_keywords = [kw for kw in store.todo if kw not in done_keywords]
     
     # 중복이 제거되었다면 파일 업데이트
-    if len(todo_keywords) != len(unique_todo_keywords):
-        logger.info(f"중복 및 완료된 키워드 제거: {len(todo_keywords)} -> {len(unique_todo_keywords)}")
-        with open(todo_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(unique_todo_keywords))
+    if store.todo_line_count != len(unique_todo_keywords):
+        logger.info("중복 및 완료된 키워드 제거: %d -> %d", store.todo_line_count, len(unique_todo_keywords))
+        store.replace_todo(unique_todo_keywords)
     
     return unique_todo_keywords
 
@@ -127,124 +528,151 @@ def update_keyword_progress(completed_keyword, output_dir):
         logger.warning("빈 키워드는 처리할 수 없습니다.")
         return False
     
-    # 키워드 디렉토리 경로 변경
-    keywords_dir = os.path.join(output_dir, "keywords")
-    os.makedirs(keywords_dir, exist_ok=True)
-    
-    todo_path = os.path.join(keywords_dir, "keywords_todo.txt")
-    done_path = os.path.join(keywords_dir, "keywords_done.txt")
-    current_keyword_path = os.path.join(keywords_dir, "current_keyword.txt")
-
-    # done 키워드 로드
-    done_keywords = set()
-    if os.path.exists(done_path):
-        with open(done_path, 'r', encoding='utf-8') as f:
-            done_keywords = {line.strip() for line in f if line.strip()}
+    store = _get_keyword_store(output_dir)
+    current_keyword_path = os.path.join(output_dir, "keywords", "current_keyword.txt")
     
     # 이미 처리된 키워드인지 확인
-    if completed_keyword in done_keywords:
-        logger.info(f"키워드 '{completed_keyword}'는 이미 처리 완료 상태입니다.")
+    if completed_keyword in store.done:
+        logger.info("키워드 '%s'는 이미 처리 완료 상태입니다.", completed_keyword)
         
         # todo 목록에서도 제거 (중복 방지)
-        if os.path.exists(todo_path):
-            todo_keywords = []
-            with open(todo_path, 'r', encoding='utf-8') as f:
-                todo_keywords = [line.strip() for line in f if line.strip()]
-            
-            if completed_keyword in todo_keywords:
-                todo_keywords.remove(completed_keyword)
-                with open(todo_path, 'w', encoding='utf-8') as f:
-                    f.write('\n'.join(todo_keywords))
-                logger.info(f"중복된 완료 키워드를 todo 목록에서 제거했습니다: {completed_keyword}")
+        if store.mark_done(completed_keyword):
+            logger.info("중복된 완료 키워드를 todo 목록에서 제거했습니다: %s", completed_keyword)
         
         return True
     
-    # todo 키워드 로드
-    todo_keywords = []
-    if os.path.exists(todo_path):
-        with open(todo_path, 'r', encoding='utf-8') as f:
-            todo_keywords = [line.strip() for line in f if line.strip()]
-    
-    # 완료된 키워드가 목록에 있으면 제거
-    if completed_keyword in todo_keywords:
-        todo_keywords.remove(completed_keyword)
-        logger.info(f"키워드 완료 처리: {completed_keyword} (남은 키워드: {len(todo_keywords)}개)")
-    
-        # todo 키워드 파일 업데이트
-        with open(todo_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(todo_keywords))
+    # 완료된 키워드를 todo에서 제거하고 done 파일에 추가
+    if store.mark_done(completed_keyword):
+        logger.info("키워드 완료 처리: %s (남은 키워드: %d개)", completed_keyword, len(store.todo))
     else:
-        logger.warning(f"키워드 '{completed_keyword}'를 todo 목록에서 찾을 수 없습니다. 그래도 완료 목록에 추가합니다.")
-    
-    # done 키워드 파일에 추가
-    with open(done_path, 'a', encoding='utf-8') as f:
-        f.write(f"{completed_keyword}\n")
+        logger.warning("키워드 '%s'를 todo 목록에서 찾을 수 없습니다. 그래도 완료 목록에 추가합니다.", completed_keyword)
     
     # current_keyword.txt 파일 업데이트 (다음 키워드로)
-    if todo_keywords:
+    next_keyword = next(iter(store.todo), None)
+    if next_keyword:
         with open(current_keyword_path, 'w', encoding='utf-8') as f:
-            f.write(todo_keywords[0])
+            f.write(next_keyword)
     
-    # done 키워드 목록 업데이트
-    done_keywords.add(completed_keyword)
-    logger.info(f"키워드 '{completed_keyword}'를 완료 목록에 추가했습니다. (총 {len(done_keywords)}개)")
+    logger.info("키워드 '%s'를 완료 목록에 추가했습니다. (총 %d개)", completed_keyword, len(store.done))
     return True
 
-def clean_keyword_files(output_dir):
+def update_keyword_progress_bulk(completed_keywords, output_dir):
     """
-    키워드 파일 정리 - 중복 제거 및 done 목록 반영
+    여러 완료 키워드를 한 번에 처리 - 키워드별로 update_keyword_progress를 호출하는 대신 사용
     
     Args:
+        completed_keywords (iterable): 완료된 키워드 목록
         output_dir (str): 출력 디렉토리
         
     Returns:
-        tuple: (todo 키워드 수, done 키워드 수)
+        int: todo 목록에서 제거된 키워드 수
+    """
+    store = _get_keyword_store(output_dir)
+    removed_count = store.mark_done_many(completed_keywords)
+    
+    # current_keyword.txt 파일 업데이트 (다음 키워드로)
+    next_keyword = next(iter(store.todo), None)
+    if next_keyword:
+        current_keyword_path = os.path.join(output_dir, "keywords", "current_keyword.txt")
+        with open(current_keyword_path, 'w', encoding='utf-8') as f:
+            f.write(next_keyword)
+    
+    logger.info("키워드 %d개 일괄 완료 처리 (남은 키워드: %d개, 완료: %d개)",
+                removed_count, len(store.todo), len(store.done))
+    return removed_count
+
+def _load_keyword_state(output_dir):
+    """
+    키워드 파일 정리/진단용 상태 로드 - todo/done 파일을 한 번만 읽어 여러 함수에서 공유
+    
+    Args:
+        output_dir (str): 출력 디렉토리
+        
+    Returns:
+        dict: todo_path, done_path, todo, done (키워드 목록, 파일이 없으면 None)
     """
-    # 키워드 디렉토리 경로 변경
     keywords_dir = os.path.join(output_dir, "keywords")
     os.makedirs(keywords_dir, exist_ok=True)
     
+    # 메모리에만 반영된 완료 처리를 먼저 파일에 기록
+    flush_keyword_progress(output_dir)
+    
+    state = {
+        'todo_path': os.path.join(keywords_dir, "keywords_todo.txt"),
+        'done_path': os.path.join(keywords_dir, "keywords_done.txt"),
+    }
+    for name in ('todo', 'done'):
+        # 존재 확인을 따로 하지 않고 열기 실패로 판단 (stat 호출 1회 절약)
+        try:
+            state[name] = _read_keyword_lines(state[f'{name}_path'])
+        except FileNotFoundError:
+            state[name] = None
+    
+    return state
+
+# output_dir별 마지막 정리 결과: ((todo 파일 시그니처, done 파일 시그니처), 반환값)
+_clean_results = {}
+
+def clean_keyword_files(output_dir, state=None):
+    """
+    키워드 파일 정리 - 중복 제거 및 done 목록 반영
+    마지막 정리 이후 두 파일이 바뀌지 않았으면 이전 결과를 그대로 반환
+    
+    Args:
+        output_dir (str): 출력 디렉토리
+        state (dict, optional): _load_keyword_state 결과 (정리된 내용으로 갱신됨)
+        
+    Returns:
+        tuple: (todo 키워드 수, done 키워드 수)
+    """
+    keywords_dir = os.path.join(output_dir, "keywords")
     todo_path = os.path.join(keywords_dir, "keywords_todo.txt")
     done_path = os.path.join(keywords_dir, "keywords_done.txt")
+    cache_key = os.path.abspath(output_dir)
     
-    # done 키워드 로드
-    done_keywords = set()
-    if os.path.exists(done_path):
-        with open(done_path, 'r', encoding='utf-8') as f:
-            done_keywords = {line.strip() for line in f if line.strip()}
-        
-        # done 파일에서 중복 제거
-        done_unique = list(done_keywords)
-        with open(done_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(done_unique))
+    if state is None:
+        # 메모리에만 반영된 완료 처리를 먼저 파일에 기록
+        flush_keyword_progress(output_dir)
+    
+    cached = _clean_results.get(cache_key)
+    if cached and cached[0] == (_file_signature(todo_path), _file_signature(done_path)):
+        return cached[1]
+    
+    if state is None:
+        state = _load_keyword_state(output_dir)
+    
+    # done 키워드 로드 (정리 중 변경되지 않으므로 frozenset)
+    done_keywords = frozenset()
+    if state['done'] is not None:
+        done_keywords = frozenset(state['done'])
         
-        logger.info(f"done 키워드 파일 정리 완료: {len(done_unique)}개")
+        # done 파일에서 중복 제거 (중복이 없으면 다시 기록하지 않음)
+        if len(state['done']) != len(done_keywords):
+            _write_keyword_lines(done_path, done_keywords)
+            logger.info(f"done 키워드 파일 정리 완료: {len(state['done'])} -> {len(done_keywords)}개")
+            state['done'] = list(done_keywords)
+        else:
+            logger.info(f"done 키워드 파일 정리 완료: {len(done_keywords)}개")
     
     # todo 키워드 로드
-    todo_keywords = []
-    if os.path.exists(todo_path):
-        with open(todo_path, 'r', encoding='utf-8') as f:
-            todo_keywords = [line.strip() for line in f if line.strip()]
-        
-        # 중복 제거 및 이미 처리된 키워드 제외
-        unique_todo = []
-        seen = set()
+    result = (0, len(done_keywords))
+    if state['todo'] is not None:
+        todo_keywords = state['todo']
         
-        for keyword in todo_keywords:
-            if keyword and keyword not in seen and keyword not in done_keywords:
-                unique_todo.append(keyword)
-                seen.add(keyword)
+        # 중복 제거(순서 유지) 및 이미 처리된 키워드 제외
+        unique_todo = [kw for kw in dict.fromkeys(todo_keywords) if kw not in done_keywords]
         
         # 변경사항이 있으면 파일 업데이트
         if len(todo_keywords) != len(unique_todo):
-            with open(todo_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(unique_todo))
+            _write_keyword_lines(todo_path, unique_todo)
             
             logger.info(f"todo 키워드 파일 정리 완료: {len(todo_keywords)} -> {len(unique_todo)}개")
+            state['todo'] = unique_todo
         
-        return len(unique_todo), len(done_keywords)
+        result = (len(unique_todo), len(done_keywords))
     
-    return 0, len(done_keywords)
+    _clean_results[cache_key] = ((_file_signature(todo_path), _file_signature(done_path)), result)
+    return result
 
 def check_keyword_status(keyword, output_dir):
     """
@@ -257,22 +685,13 @@ def check_keyword_status(keyword, output_dir):
     Returns:
         str: 'todo', 'done', 'none' 중 하나
     """
-    # 키워드 디렉토리 경로 변경
-    keywords_dir = os.path.join(output_dir, "keywords")
-    todo_path = os.path.join(keywords_dir, "keywords_todo.txt")
-    done_path = os.path.join(keywords_dir, "keywords_done.txt")
+    store = _get_keyword_store(output_dir)
     
-    # done 키워드 확인
-    if os.path.exists(done_path):
-        with open(done_path, 'r', encoding='utf-8') as f:
-            if keyword in {line.strip() for line in f if line.strip()}:
-                return 'done'
+    if keyword in store.done:
+        return 'done'
     
-    # todo 키워드 확인
-    if os.path.exists(todo_path):
-        with open(todo_path, 'r', encoding='utf-8') as f:
-            if keyword in {line.strip() for line in f if line.strip()}:
-                return 'todo'
+    if keyword in store.todo:
+        return 'todo'
     
     return 'none'
 
@@ -283,14 +702,10 @@ def generate_initial_keywords():
     Returns:
         list: 초기 키워드 목록
     """
-    return [
-        "타이레놀", "게보린", "아스피린", "부루펜", "판피린", "판콜", 
-        "텐텐", "이가탄", "베아제", "훼스탈", "백초시럽", "판콜에이", 
-        "신신파스", "포카시엘", "우루사", "인사돌", "센트럼", "삐콤씨", 
-        "컨디션", "박카스", "아로나민", "아모잘탄", "엔테론", "듀파락"
-    ]
+    return list(_INITIAL_KEYWORDS)
 
 # 2. 키워드 유효성 검사 함수 개선 (기존 is_generic_medicine_name 대체)
+@lru_cache(maxsize=16384)
 def is_generic_medicine_name(keyword):
     """
     일반적인 의약품 이름인지 확인 - 개선된 버전
@@ -305,53 +720,35 @@ def is_generic_medicine_name(keyword):
         return False
     
     # 무의미한 패턴 제외
-    invalid_patterns = [
-        r'^중\s*$', r'^\s*중$', r'^mg\s*$', r'^\s*mg$',
-        r'^g\s*$', r'^\s*g$', r'^ml\s*$', r'^\s*ml$',
-        r'^각\s*$', r'^\s*각$', r'^및\s*$', r'^\s*및$',
-        r'^염산$', r'^황산$', r'^ml 중$', r'^mL 중$', r'^L 중$'
-    ]
-    
-    for pattern in invalid_patterns:
-        if re.match(pattern, keyword):
-            return False
+    if _INVALID_KEYWORD_RE.match(keyword):
+        return False
     
     # 의미없는 단일 문자 키워드 제외
-    single_chars = ['L', 'A', 'B', 'C', 'E', 'g', 'l', 'p', 'd']
-    if keyword in single_chars:
-        return False
-        
-    # 너무 짧거나 긴 키워드 제외
-    if len(keyword) < 2 or len(keyword) > 20:
+    if keyword in _SINGLE_CHAR_KEYWORDS:
         return False
         
-    # 숫자만 있는 키워드 제외
-    if keyword.isdigit():
+    # 너무 긴 키워드 제외 (짧은 키워드는 위에서 제외됨)
+    if len(keyword) > 20:
         return False
     
     # 특수문자 비율이 높은 키워드 제외
-    special_char_count = sum(1 for c in keyword if not c.isalnum() and c not in ' -')
+    special_char_count = len(_GENERIC_SPECIAL_CHAR_RE.findall(keyword))
     if special_char_count > len(keyword) * 0.2:
         return False
     
-    # 숫자가 포함된 키워드는 특정 패턴만 허용
-    has_digit = any(c.isdigit() for c in keyword)
-    if has_digit:
+    # 숫자가 포함된 키워드는 특정 패턴만 허용 (숫자만 있는 키워드도 여기서 제외됨)
+    if any(map(str.isdigit, keyword)):
         # '정', '캡슐', '시럽' 등이 포함된 경우는 허용 
-        if any(term in keyword for term in ['정', '캡슐', '시럽', '주', '액', '크림', '겔', '로션']):
+        if _DOSAGE_FORM_RE.search(keyword):
             return True
         # 그 외의 숫자 포함 키워드는 제외
         return False
     
-    # 용매/성분만 있는 키워드 제외
-    common_components = [
-        '염산염', '황산염', '말레산염', '타르타르산염', '수화물', '질산염', 
-        '아세트산염', '시트르산염', '포스페이트', '베실산염', '글루콘산염'
-    ]
-    
-    for comp in common_components:
-        if keyword.endswith(comp) and len(keyword) - len(comp) < 3:
-            return False
+    # 용매/성분만 있는 키워드 제외 (대부분의 키워드는 튜플 endswith 한 번으로 통과)
+    if keyword.endswith(_COMMON_COMPONENT_SUFFIXES):
+        for comp in _COMMON_COMPONENT_SUFFIXES:
+            if keyword.endswith(comp) and len(keyword) - len(comp) < 3:
+                return False
     
     return True
 
@@ -366,66 +763,17 @@ def generate_extensive_initial_keywords(output_dir):
     Returns:
         int: 추가된 키워드 개수
     """
-    # 키워드 디렉토리 경로 변경
-    keywords_dir = os.path.join(output_dir, "keywords")
-    os.makedirs(keywords_dir, exist_ok=True)
-    
-    todo_path = os.path.join(keywords_dir, "keywords_todo.txt")
-    done_path = os.path.join(keywords_dir, "keywords_done.txt")
-    
-    # done 키워드 로드
-    done_keywords = set()
-    if os.path.exists(done_path):
-        with open(done_path, 'r', encoding='utf-8') as f:
-            done_keywords = {line.strip() for line in f if line.strip()}
-    
-    # todo 키워드 로드
-    todo_keywords = set()
-    if os.path.exists(todo_path):
-        with open(todo_path, 'r', encoding='utf-8') as f:
-            todo_keywords = {line.strip() for line in f if line.strip()}
-    
-    # 확장된 초기 키워드 목록
-    extensive_keywords = [
-        # 일반 의약품 분류
-        "진통제", "해열제", "감기약", "소화제", "제산제", "지사제", "변비약", 
-        "비타민", "종합비타민", "구충제", "항히스타민제", "항생제", "소염진통제",
-        
-        # 처방약 분류
-        "고혈압약", "당뇨약", "콜레스테롤약", "항응고제", "항우울제", "항불안제",
-        "수면제", "갑상선약", "관절염약", "천식약", "간질약", "빈혈약",
-        
-        # 의약품 투여 형태
-        "정제", "캡슐", "주사제", "연고", "크림", "점안액", "점이액", 
-        "좌제", "시럽", "패치", "겔", "스프레이",
-        
-        # 다빈도 일반의약품 브랜드
-        "타이레놀", "게보린", "판콜", "베아제", "인사돌", "텐텐", "판피린",
-        "부루펜", "아스피린", "판콜에이", "신신파스", "이가탄", "훼스탈", 
-        "백초시럽", "센트룸", "삐콤씨", "컨디션", "박카스", "라니티딘",
-        
-        # 다빈도 처방약 성분
-        "아목시실린", "세티리진", "로라타딘", "디클로페낙", "메트포민",
-        "심바스타틴", "아토르바스타틴", "암로디핀", "오메프라졸", "라니티딘",
-        "독시사이클린", "세파클러", "아세트아미노펜", "이부프로펜", "리도카인",
-        
-        # 일반 의약품 효능군
-        "두통약", "치통약", "생리통약", "근육통약", "관절통약", "소화촉진제",
-        "비염약", "기침약", "가래약", "멀미약", "숙취해소제", "알레르기약",
-        "피부연고", "습포제", "구내염약", "안약", "피로회복제", "변비약"
-    ]
+    # done / todo 키워드 (파일이 바뀐 경우에만 다시 읽는 저장소 사용)
+    store = _get_keyword_store(output_dir)
     
     # 이미 처리된 키워드와 처리 예정 키워드 제외
-    existing_keywords = done_keywords.union(todo_keywords)
-    new_keywords = [kw for kw in extensive_keywords if kw not in existing_keywords]
+    new_keywords = _EXTENSIVE_INITIAL_KEYWORDS.difference(store.done, store.todo)
     
-    # 새 키워드를 todo 파일에 추가
+    # 새 키워드만 todo 파일 끝에 추가
     if new_keywords:
-        updated_todo = todo_keywords.union(new_keywords)
-        with open(todo_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(updated_todo))
+        store.append_todo(new_keywords)
         
-        logger.info(f"{len(new_keywords)}개 확장 초기 키워드 추가됨 (총 {len(updated_todo)}개)")
+        logger.info(f"{len(new_keywords)}개 확장 초기 키워드 추가됨 (총 {len(store.todo)}개)")
         return len(new_keywords)
     
     logger.info("추가할 새 키워드가 없습니다.")
@@ -458,23 +806,92 @@ def ensure_keywords_available(output_dir, json_dir=None):
     
     # 3. todo 키워드가 없으면 핵심 키워드만 생성
     if not todo_keywords:
-        # 초기 키워드 생성
-        initial_keywords = [
-            # 검색 확률이 높은 주요 일반의약품만 선택
-            "타이레놀", "게보린", "판콜", "부루펜", "판피린", 
-            "우루사", "훼스탈", "아로나민", "베아제", "컨디션"
-        ]
-        
-        # 파일에 저장
-        with open(todo_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(initial_keywords))
+        # 초기 키워드 생성 후 파일에 저장
+        _write_keyword_lines(todo_path, _CORE_INITIAL_KEYWORDS)
         
-        logger.info(f"초기 키워드 {len(initial_keywords)}개 생성됨")
+        logger.info(f"초기 키워드 {len(_CORE_INITIAL_KEYWORDS)}개 생성됨")
         return True
     
     logger.info(f"처리할 키워드가 {len(todo_keywords)}개 있습니다.")
     return True
 
+def _extract_classification_keywords(field_value, candidates):
+    """분류 필드에서 키워드 후보 추출 (예: [01140]해열.진통.소염제)"""
+    # 분류 코드와 이름 분리 후 각각 추가
+    for code, name in _CLASS_CODE_RE.findall(field_value):
+        code = code.strip()
+        if len(code) >= 2:
+            candidates.add(code)
+        name = name.strip()
+        if len(name) >= 2:
+            candidates.add(name)
+    
+    # 카테고리 계층 분리 (> 또는 . 기준), 괄호 제거 및 공백 제거
+    for cls in _CLASS_SPLIT_RE.split(field_value):
+        cls = _BRACKET_RE.sub('', cls).strip()
+        if len(cls) >= 2:
+            candidates.add(cls)
+
+def _extract_list_keywords(field_value, candidates):
+    """구분/제형 필드에서 키워드 후보 추출 (복합 값 분리, 예: 일반의약품/상비약)"""
+    for item in _LIST_SPLIT_RE.split(field_value):
+        item = item.strip()
+        if len(item) >= 2:
+            candidates.add(item)
+
+def _extract_company_keywords(field_value, candidates):
+    """업체명 필드에서 키워드 후보 추출"""
+    # 회사명에서 괄호 내용 제거 (예: (주)휴온스 -> 휴온스)
+    company_name = _PAREN_RE.sub('', field_value).strip()
+    
+    # 회사명이 여러 단어로 구성된 경우 각 부분 추출 (예: 한국얀센제약 -> 한국얀센, 제약)
+    # '주식회사', '제약', '약품' 등 일반 단어는 제외
+    for part in _COMPANY_PART_RE.findall(company_name):
+        if len(part) >= 2 and part not in _COMPANY_COMMON_WORDS:
+            candidates.add(part)
+    
+    # 전체 회사명도 추가
+    if len(company_name) >= 2:
+        candidates.add(company_name)
+
+def _extract_appearance_keywords(field_value, candidates):
+    """성상 필드에서 색상 / 제형 키워드 후보 추출"""
+    # 패턴마다 그룹이 하나이므로 findall은 문자열 목록을 반환
+    for pattern in chain(_COLOR_RES, _SHAPE_RES):
+        candidates.update(match for match in pattern.findall(field_value) if len(match) >= 2)
+
+# 표준화된 필드명별 키워드 추출 함수
+_FIELD_EXTRACTORS = {
+    'classification': _extract_classification_keywords,  # 분류
+    'category': _extract_list_keywords,                  # 구분 (일반의약품, 전문의약품 등)
+    'company': _extract_company_keywords,                # 업체명
+    'appearance': _extract_appearance_keywords,          # 성상
+    'shape_type': _extract_list_keywords,                # 제형
+}
+
+def _extract_keywords_from_file(file_path):
+    """
+    단일 JSON 파일에서 키워드 후보 추출 (프로세스 풀 작업 단위)
+    
+    Args:
+        file_path (str): JSON 파일 경로
+        
+    Returns:
+        tuple: (키워드 후보 집합, 오류 메시지 또는 None)
+    """
+    new_keyword_candidates = set()
+    try:
+        data = _load_json_file(file_path)
+        
+        # 각 필드에서 키워드 추출
+        for orig_field, std_field in _KEYWORD_FIELD_MAPPING.items():
+            if orig_field in data and data[orig_field] and data[orig_field] != "정보 없음":
+                _FIELD_EXTRACTORS[std_field](data[orig_field], new_keyword_candidates)
+    except Exception as e:
+        return new_keyword_candidates, str(e)
+    
+    return new_keyword_candidates, None
+
 def generate_medicine_keywords(output_dir, json_dir=None, max_new_keywords=20, similarity_threshold=0.8):
     """
     JSON 파일에서 의약품 관련 키워드를 추출
@@ -488,13 +905,6 @@ def generate_medicine_keywords(output_dir, json_dir=None, max_new_keywords=20, s
     Returns:
         int: 추가된 키워드 수
     """
-    # 키워드 디렉토리 경로 변경
-    keywords_dir = os.path.join(output_dir, "keywords")
-    os.makedirs(keywords_dir, exist_ok=True)
-    
-    todo_path = os.path.join(keywords_dir, "keywords_todo.txt")
-    done_path = os.path.join(keywords_dir, "keywords_done.txt")
-    
     logger.info("JSON 파일에서 의약품 키워드 추출 중...")
     
     # JSON 파일 디렉토리 확인
@@ -504,8 +914,9 @@ def generate_medicine_keywords(output_dir, json_dir=None, max_new_keywords=20, s
             logger.warning(f"JSON 디렉토리를 찾을 수 없습니다: {json_dir}")
             return 0
     
-    # JSON 파일 목록
-    json_files = [f for f in os.listdir(json_dir) if f.endswith('.json')]
+    # JSON 파일 목록 (scandir 항목의 경로를 그대로 사용)
+    with os.scandir(json_dir) as entries:
+        json_files = [entry.path for entry in entries if entry.name.endswith('.json')]
     
     if not json_files:
         logger.warning(f"JSON 디렉토리에 파일이 없습니다: {json_dir}")
@@ -513,150 +924,45 @@ def generate_medicine_keywords(output_dir, json_dir=None, max_new_keywords=20, s
     
     logger.info(f"{len(json_files)}개 JSON 파일에서 키워드 추출 시작")
     
-    # done 키워드 로드
-    done_keywords = set()
-    if os.path.exists(done_path):
-        with open(done_path, 'r', encoding='utf-8') as f:
-            done_keywords = {line.strip() for line in f if line.strip()}
-    
-    # todo 키워드 로드
-    todo_keywords = set()
-    if os.path.exists(todo_path):
-        with open(todo_path, 'r', encoding='utf-8') as f:
-            todo_keywords = {line.strip() for line in f if line.strip()}
-    
-    # 기존 키워드
-    existing_keywords = done_keywords.union(todo_keywords)
-    logger.info(f"중복 검사를 위한 기존 키워드: {len(existing_keywords)}개 (done: {len(done_keywords)}, todo: {len(todo_keywords)})")
+    # 기존 키워드 (추출 중에는 변하지 않으므로 한 번만 구성)
+    store = _get_keyword_store(output_dir)
+    existing_keywords = frozenset(chain(store.done, store.todo))
+    logger.info(f"중복 검사를 위한 기존 키워드: {len(existing_keywords)}개 (done: {len(store.done)}, todo: {len(store.todo)})")
     
     # 새 키워드 후보
     new_keyword_candidates = set()
     
-    # 필드 매핑 (JSON 필드명이 다를 경우를 위한 매핑)
-    field_mapping = {
-        # 원래 JSON 필드명: 표준화된 필드명
-        'classification': 'classification',  # 분류
-        'category': 'category',              # 구분
-        'category_name': 'category', 
-        'company': 'company',                # 업체명
-        'company_name': 'company',
-        'appearance': 'appearance',          # 성상
-        'shape_type': 'shape_type',          # 제형
-        'shape_info': 'shape_type'
-    }
+    # JSON 파일에서 키워드 추출 (파일별 독립 작업이므로 파일이 많으면 프로세스 풀로 병렬 처리)
+    # 다중 스레드 수집기에서 fork하면 잠금/키워드 저장소 상태를 물려받으므로 spawn으로 시작
+    target_paths = json_files[:500]
+    failed_files = []
+    use_pool = len(target_paths) >= _PARALLEL_EXTRACT_MIN_FILES
+    with (ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) if use_pool else nullcontext()) as executor, \
+            tqdm(total=len(target_paths), desc="키워드 추출 중", mininterval=0.5,
+                 disable=not sys.stderr.isatty()) as pbar:
+        if executor is not None:
+            results = executor.map(_extract_keywords_from_file, target_paths, chunksize=16)
+        else:
+            results = map(_extract_keywords_from_file, target_paths)
+        for idx, (file_path, (candidates, error)) in enumerate(zip(target_paths, results), 1):
+            new_keyword_candidates.update(map(sys.intern, candidates))
+            if error:
+                failed_files.append(f"{os.path.basename(file_path)} ({error})")
+            
+            # 진행률은 64개 단위로 갱신
+            if idx % 64 == 0:
+                pbar.update(64)
+        pbar.update(len(target_paths) - pbar.n)
     
-    # JSON 파일에서 키워드 추출
-    from tqdm import tqdm
-    for json_file in tqdm(json_files[:min(500, len(json_files))], desc="키워드 추출 중"):
-        try:
-            file_path = os.path.join(json_dir, json_file)
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-                # 각 필드에서 키워드 추출
-                for orig_field, std_field in field_mapping.items():
-                    if orig_field in data and data[orig_field] and data[orig_field] != "정보 없음":
-                        field_value = data[orig_field]
-                        
-                        # 1. 분류 필드 특별 처리
-                        if std_field == 'classification':
-                            # 분류 코드와 이름 분리 (예: [01140]해열.진통.소염제)
-                            class_matches = re.findall(r'\[([^\]]+)\]([^,\[]+)', field_value)
-                            if class_matches:
-                                for code, name in class_matches:
-                                    # 코드와 이름 각각 추가
-                                    if code.strip() and len(code.strip()) >= 2:
-                                        new_keyword_candidates.add(code.strip())
-                                    if name.strip() and len(name.strip()) >= 2:
-                                        new_keyword_candidates.add(name.strip())
-                            
-                            # 카테고리 계층 분리 (> 또는 . 기준)
-                            classes = re.split(r'[/>.]', field_value)
-                            for cls in classes:
-                                # 괄호 제거 및 공백 제거
-                                cls = re.sub(r'\[[^\]]*\]', '', cls).strip()
-                                if cls and len(cls) >= 2:
-                                    new_keyword_candidates.add(cls)
-                        
-                        # 2. 구분 필드 처리 (일반의약품, 전문의약품 등)
-                        elif std_field == 'category':
-                            # 복합 카테고리 분리
-                            categories = re.split(r'[/,]', field_value)
-                            for cat in categories:
-                                cat = cat.strip()
-                                if cat and len(cat) >= 2:
-                                    new_keyword_candidates.add(cat)
-                        
-                        # 3. 업체명 필드 처리
-                        elif std_field == 'company':
-                            # 회사명에서 괄호 내용 제거 (예: (주)휴온스 -> 휴온스)
-                            company_name = re.sub(r'\([^)]*\)', '', field_value).strip()
-                            
-                            # 회사명이 여러 단어로 구성된 경우 각 부분 추출 (예: 한국얀센제약 -> 한국얀센, 제약)
-                            company_parts = re.findall(r'([가-힣A-Za-z]{2,})', company_name)
-                            
-                            for part in company_parts:
-                                if part and len(part) >= 2:
-                                    # '주식회사', '제약', '약품' 등 일반 단어는 제외
-                                    common_words = ['주식회사', '제약', '약품', '바이오', '팜', '케미칼']
-                                    if part not in common_words:
-                                        new_keyword_candidates.add(part)
-                            
-                            # 전체 회사명도 추가
-                            if company_name and len(company_name) >= 2:
-                                new_keyword_candidates.add(company_name)
-                        
-                        # 4. 성상 필드 처리
-                        elif std_field == 'appearance':
-                            # 색상 추출 (성상에서 색상 정보 추출)
-                            color_patterns = [
-                                r'(흰색|백색|노란색|노랑|황색|주황색|빨간색|적색|분홍색|핑크색|보라색|자주색|파란색|청색|녹색|초록색|갈색|회색|검정색|투명)',
-                                r'([가-힣]+(?:색|빛))'
-                            ]
-                            
-                            for pattern in color_patterns:
-                                colors = re.findall(pattern, field_value)
-                                for color in colors:
-                                    if isinstance(color, str) and color and len(color) >= 2:
-                                        new_keyword_candidates.add(color)
-                                    elif isinstance(color, tuple):
-                                        for c in color:
-                                            if c and len(c) >= 2:
-                                                new_keyword_candidates.add(c)
-                            
-                            # 제형 정보 추출 (성상에서 제형 정보 추출)
-                            shape_patterns = [
-                                r'(정제|캡슐|시럽|액제|주사제|연고|크림|겔|좌제|산제|과립제|트로키|패치|스프레이)',
-                                r'([가-힣]+(?:형|모양))'
-                            ]
-                            
-                            for pattern in shape_patterns:
-                                shapes = re.findall(pattern, field_value)
-                                for shape in shapes:
-                                    if isinstance(shape, str) and shape and len(shape) >= 2:
-                                        new_keyword_candidates.add(shape)
-                                    elif isinstance(shape, tuple):
-                                        for s in shape:
-                                            if s and len(s) >= 2:
-                                                new_keyword_candidates.add(s)
-                        
-                        # 5. 제형 필드 처리
-                        elif std_field == 'shape_type':
-                            # 제형 추출
-                            shape_types = re.split(r'[/,]', field_value)
-                            for shape_type in shape_types:
-                                shape_type = shape_type.strip()
-                                if shape_type and len(shape_type) >= 2:
-                                    new_keyword_candidates.add(shape_type)
-        
-        except Exception as e:
-            logger.warning(f"파일 {json_file} 처리 중 오류: {str(e)}")
-    
-    # 키워드 필터링
-    filtered_keywords = []
+    if failed_files:
+        logger.warning("%d개 파일 처리 중 오류: %s%s", len(failed_files), ', '.join(failed_files[:5]),
+                       " ..." if len(failed_files) > 5 else "")
+    
+    # 키워드 필터링 (정규화 결과가 같은 후보는 집합에서 바로 중복 제거)
+    filtered_keywords = set()
     for keyword in new_keyword_candidates:
         # 숫자나 단위가 포함된 키워드 제외
-        if re.search(r'\d+\s*(?:mg|ml|g|mcg|μg|%|정|캡슐)', keyword):
+        if _DOSE_UNIT_RE.search(keyword):
             continue
             
         # 너무 짧거나 긴 키워드 제외
@@ -664,127 +970,98 @@ def generate_medicine_keywords(output_dir, json_dir=None, max_new_keywords=20, s
             continue
             
         # 특수문자 포함 키워드 제외 (일부 허용)
-        if re.search(r'[^\w\s가-힣.-]', keyword):
+        if _DISALLOWED_CHAR_RE.search(keyword):
             continue
             
         # 키워드 정규화
         keyword = normalize_keyword(keyword)
         if keyword and len(keyword) >= 2:
-            filtered_keywords.append(keyword)
-    
-    # 중복 제거
-    filtered_keywords = list(set(filtered_keywords))
+            filtered_keywords.add(sys.intern(keyword))
     
     # 최대 키워드 수 제한
-    filtered_keywords = filtered_keywords[:max_new_keywords]
+    filtered_keywords = list(islice(filtered_keywords, max_new_keywords))
     
     # 기존 키워드와 중복 제외
     truly_new_keywords = [kw for kw in filtered_keywords if kw not in existing_keywords]
     
     # todo 파일에 추가
     if truly_new_keywords:
-        # 현재 todo 키워드 불러오기
-        current_todo = []
-        if os.path.exists(todo_path):
-            with open(todo_path, 'r', encoding='utf-8') as f:
-                current_todo = [line.strip() for line in f if line.strip()]
+        store.reload_if_changed()
+        store.append_todo(truly_new_keywords)
         
-        # 새 키워드 추가
-        updated_todo = current_todo + truly_new_keywords
-        
-        # 파일에 저장
-        with open(todo_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(updated_todo))
-        
-        logger.info(f"{len(truly_new_keywords)}개 키워드가 JSON 파일에서 추출되어 추가됨 (총 {len(updated_todo)}개)")
+        logger.info(f"{len(truly_new_keywords)}개 키워드가 JSON 파일에서 추출되어 추가됨 (총 {len(store.todo)}개)")
         return len(truly_new_keywords)
     else:
         logger.info("JSON 파일에서 추가할 새 키워드가 없습니다.")
         return 0
-    
-def check_keyword_status(keyword, output_dir):
-    """
-    키워드의 현재 상태 확인 (todo, done, 없음)
-    
-    Args:
-        keyword (str): 확인할 키워드
-        output_dir (str): 출력 디렉토리
-        
-    Returns:
-        str: 'todo', 'done', 'none' 중 하나
-    """
-    # 키워드 디렉토리 경로 변경
-    keywords_dir = os.path.join(output_dir, "keywords")
-    todo_path = os.path.join(keywords_dir, "keywords_todo.txt")
-    done_path = os.path.join(keywords_dir, "keywords_done.txt")
-    
-    # done 키워드 확인
-    if os.path.exists(done_path):
-        with open(done_path, 'r', encoding='utf-8') as f:
-            if keyword in {line.strip() for line in f if line.strip()}:
-                return 'done'
-    
-    # todo 키워드 확인
-    if os.path.exists(todo_path):
-        with open(todo_path, 'r', encoding='utf-8') as f:
-            if keyword in {line.strip() for line in f if line.strip()}:
-                return 'todo'
-    
-    return 'none'
 
-def test_keyword_management(output_dir):
+def _log_duplicate_sample(keywords):
+    """중복 키워드 일부(최대 5개)를 디버그 로그로 출력 - 디버그 비활성 시 문자열을 만들지 않음"""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("중복 키워드: %s%s", ', '.join(islice(keywords, 5)), "..." if len(keywords) > 5 else "")
+
+def test_keyword_management(output_dir, state=None):
     """
     키워드 관리 기능 테스트 - 문제 발견을 위한 진단 도구
     
     Args:
         output_dir (str): 출력 디렉토리
+        state (dict, optional): _load_keyword_state 결과 (clean_keyword_files와 공유 시 파일을 다시 읽지 않음)
         
     Returns:
         bool: 테스트 성공 여부
     """
     logger.info("키워드 관리 시스템 테스트 시작...")
     
-    todo_path = os.path.join(output_dir, "keywords_todo.txt")
-    done_path = os.path.join(output_dir, "keywords_done.txt")
+    # todo 파일이 없던 상태라면 그 사이 생성되었을 수 있으므로 다시 로드
+    if state is None or state['todo'] is None:
+        state = _load_keyword_state(output_dir)
+    
+    todo_path = state['todo_path']
+    done_path = state['done_path']
     
     # 파일 존재 확인
-    if not os.path.exists(todo_path):
+    if state['todo'] is None:
         logger.error(f"keywords_todo.txt 파일이 없습니다: {todo_path}")
         return False
     
-    if not os.path.exists(done_path):
+    if state['done'] is None:
         logger.warning(f"keywords_done.txt 파일이 없습니다: {done_path}")
         # done 파일 생성
         with open(done_path, 'w', encoding='utf-8') as f:
             f.write("")
         logger.info("빈 keywords_done.txt 파일을 생성했습니다.")
+        state['done'] = []
     
     # 중복 테스트
-    todo_keywords = []
-    with open(todo_path, 'r', encoding='utf-8') as f:
-        todo_keywords = [line.strip() for line in f if line.strip()]
+    todo_keywords = state['todo']
+    done_keywords = state['done']
+    
+    todo_set = set(todo_keywords)
+    done_set = frozenset(done_keywords)
     
-    done_keywords = []
-    with open(done_path, 'r', encoding='utf-8') as f:
-        done_keywords = [line.strip() for line in f if line.strip()]
+    # 내부 중복 확인 (길이가 같으면 중복이 없으므로 개수 집계 생략)
+    todo_duplicates = set()
+    if len(todo_set) != len(todo_keywords):
+        todo_duplicates = {kw for kw, count in Counter(todo_keywords).items() if count > 1}
     
-    # 내부 중복 확인
-    todo_duplicates = set([kw for kw in todo_keywords if todo_keywords.count(kw) > 1])
-    done_duplicates = set([kw for kw in done_keywords if done_keywords.count(kw) > 1])
+    done_duplicates = set()
+    if len(done_set) != len(done_keywords):
+        done_duplicates = {kw for kw, count in Counter(done_keywords).items() if count > 1}
     
     if todo_duplicates:
         logger.warning(f"todo 목록에 중복된 키워드가 있습니다: {len(todo_duplicates)}개")
-        logger.debug(f"중복 키워드: {', '.join(list(todo_duplicates)[:5])}..." if len(todo_duplicates) > 5 else f"중복 키워드: {', '.join(todo_duplicates)}")
+        _log_duplicate_sample(todo_duplicates)
     
     if done_duplicates:
         logger.warning(f"done 목록에 중복된 키워드가 있습니다: {len(done_duplicates)}개")
-        logger.debug(f"중복 키워드: {', '.join(list(done_duplicates)[:5])}..." if len(done_duplicates) > 5 else f"중복 키워드: {', '.join(done_duplicates)}")
+        _log_duplicate_sample(done_duplicates)
     
     # todo와 done 사이 중복 확인
-    common_keywords = set(todo_keywords).intersection(set(done_keywords))
+    common_keywords = todo_set & done_set
     if common_keywords:
         logger.warning(f"todo와 done 목록 사이에 중복된 키워드가 있습니다: {len(common_keywords)}개")
-        logger.debug(f"중복 키워드: {', '.join(list(common_keywords)[:5])}..." if len(common_keywords) > 5 else f"중복 키워드: {', '.join(common_keywords)}")
+        _log_duplicate_sample(common_keywords)
     
     # 테스트 결과: 중복 없는 정상 상태면 True
     test_result = not (todo_duplicates or done_duplicates or common_keywords)
@@ -798,6 +1075,29 @@ def test_keyword_management(output_dir):
     return test_result
 
 # 3. 알파벳/한글 기반 체계적 키워드 생성 전략 (새 함수 추가)
+# 알파벳/한글 검색 전략 - 검색 범위 정의
+_SEARCH_CHARS = {
+    'korean': ('가', '나', '다', '라', '마', '바', '사', '아', '자', '차', '카', '타', '파', '하'),
+    'english': tuple('ABCDEFGHIJKLMNOPQRSTUVWXYZ'),
+    'korean_extensions': ('강', '경', '고', '구', '기', '두', '리', '미', '백', '복', '성', '신', '영', '원', '제', '진', '현')
+}
+
+# 의약품 접미사/조합
+_MEDICINE_SUFFIXES = ('정', '캡슐', '주', '시럽', '크림', '액', '겔', '파스', '연고', '약')
+
+# 의약품 제조사 목록 (상위 제약사 키워드)
+_MANUFACTURERS = (
+    '한미', '동아', '유한양행', '종근당', '녹십자', '일동', '대웅',
+    '광동', '보령', '삼진', '제일', '셀트리온', '한국얀센'
+)
+
+# 일반 분류 키워드
+_SEARCH_CATEGORIES = (
+    '항생제', '진통제', '해열제', '소화제', '항히스타민제',
+    '당뇨약', '고혈압약', '콜레스테롤약', '항응고제', '항우울제', 
+    '수면제', '항불안제', '갑상선약', '관절염약', '천식약'
+)
+
 def alphabetical_search_strategy(output_dir):
     """
     확률 기반 알파벳/한글 자모별 순차적 검색 전략
@@ -815,43 +1115,20 @@ def alphabetical_search_strategy(output_dir):
     # 진행 상황 파일
     progress_path = os.path.join(keywords_dir, "search_progress.json")
     
-    # 검색 범위 정의
-    search_chars = {
-        'korean': ['가', '나', '다', '라', '마', '바', '사', '아', '자', '차', '카', '타', '파', '하'],
-        'english': list('ABCDEFGHIJKLMNOPQRSTUVWXYZ'),
-        'korean_extensions': ['강', '경', '고', '구', '기', '두', '리', '미', '백', '복', '성', '신', '영', '원', '제', '진', '현']
-    }
-    
-    # 의약품 접미사/조합
-    medicine_suffixes = ['정', '캡슐', '주', '시럽', '크림', '액', '겔', '파스', '연고', '약']
-    
     # 진행 상황 로드 또는 초기화
     if os.path.exists(progress_path):
         with open(progress_path, 'r', encoding='utf-8') as f:
             progress = json.load(f)
     else:
         progress = {
-            'korean': {char: False for char in search_chars['korean']},
-            'english': {char: False for char in search_chars['english']},
-            'korean_extensions': {char: False for char in search_chars['korean_extensions']},
+            'korean': {char: False for char in _SEARCH_CHARS['korean']},
+            'english': {char: False for char in _SEARCH_CHARS['english']},
+            'korean_extensions': {char: False for char in _SEARCH_CHARS['korean_extensions']},
             'medicine_combinations': {f"{char}{suffix}": False 
-                                     for char in search_chars['korean'] 
-                                     for suffix in medicine_suffixes}
+                                     for char in _SEARCH_CHARS['korean'] 
+                                     for suffix in _MEDICINE_SUFFIXES}
         }
     
-    # 의약품 제조사 목록 (상위 제약사 키워드)
-    manufacturers = [
-        '한미', '동아', '유한양행', '종근당', '녹십자', '일동', '대웅',
-        '광동', '보령', '삼진', '제일', '셀트리온', '한국얀센'
-    ]
-    
-    # 일반 분류 키워드
-    categories = [
-        '항생제', '진통제', '해열제', '소화제', '항히스타민제',
-        '당뇨약', '고혈압약', '콜레스테롤약', '항응고제', '항우울제', 
-        '수면제', '항불안제', '갑상선약', '관절염약', '천식약'
-    ]
-    
     # 결과 키워드 목록
     next_chars = []
     
@@ -882,7 +1159,7 @@ def alphabetical_search_strategy(output_dir):
                     progress[category][combo] = True
         else:
             # 기본 문자에서 완료되지 않은 것들
-            incomplete_chars = [char for char in search_chars[category] 
+            incomplete_chars = [char for char in _SEARCH_CHARS[category] 
                               if char in progress[category] and not progress[category][char]]
             if incomplete_chars:
                 selected = random.sample(incomplete_chars, min(2, len(incomplete_chars)))
@@ -892,9 +1169,9 @@ def alphabetical_search_strategy(output_dir):
     
     # 3. 무작위로 제조사 + 분류 조합 추가 (새로운 조합)
     if random.random() < 0.7:  # 70% 확률로 추가
-        for _ in range(min(2, len(manufacturers))):
-            manufacturer = random.choice(manufacturers)
-            category = random.choice(categories)
+        for _ in range(min(2, len(_MANUFACTURERS))):
+            manufacturer = random.choice(_MANUFACTURERS)
+            category = random.choice(_SEARCH_CATEGORIES)
             combo = f"{manufacturer} {category}"
             next_chars.append(combo)
     
@@ -902,8 +1179,8 @@ def alphabetical_search_strategy(output_dir):
     if not next_chars:
         # 제조사와 카테고리 조합으로 새 키워드 생성
         for _ in range(5):
-            manufacturer = random.choice(manufacturers)
-            category = random.choice(categories)
+            manufacturer = random.choice(_MANUFACTURERS)
+            category = random.choice(_SEARCH_CATEGORIES)
             # 조합 방식 다양화
             if random.random() < 0.5:
                 combo = f"{manufacturer} {category}"
@@ -913,8 +1190,8 @@ def alphabetical_search_strategy(output_dir):
         
         # 특정 의약품 형태 키워드 추가
         for _ in range(3):
-            korean_char = random.choice(search_chars['korean'])
-            suffix = random.choice(medicine_suffixes)
+            korean_char = random.choice(_SEARCH_CHARS['korean'])
+            suffix = random.choice(_MEDICINE_SUFFIXES)
             next_chars.append(f"{korean_char}{suffix}")
     
     # 진행 상황 저장
@@ -944,15 +1221,16 @@ if __name__ == "__main__":
     # 디렉토리 생성
     os.makedirs(output_dir, exist_ok=True)
     
-    # 키워드 파일 정리
-    clean_keyword_files(output_dir)
+    # 키워드 파일 정리 (정리/테스트에서 같은 파일 내용을 공유)
+    keyword_state = _load_keyword_state(output_dir)
+    clean_keyword_files(output_dir, keyword_state)
     
     # 키워드 로드
     todo_keywords = load_keywords(output_dir)
     logger.info(f"처리할 키워드: {len(todo_keywords)}개")
     
     # 키워드 관리 테스트
-    test_keyword_management(output_dir)
+    test_keyword_management(output_dir, keyword_state)
     
     # 추가 키워드 생성 (JSON 파일이 있는 경우)
     if os.path.exists(json_dir) and os.listdir(json_dir):
@@ -19,7 +19,10 @@ def clean_data_directory(base_dir='collected_data'):
         os.path.join(base_dir, 'current_keyword.txt'), 
         os.path.join(base_dir, 'keywords_todo.txt'), 
         os.path.join(base_dir, 'keywords_done.txt'),
-        os.path.join(base_dir, 'processed_medicine_ids.txt')
+        os.path.join(base_dir, 'processed_medicine_ids.txt'),
+        os.path.join(base_dir, 'processed_ids.sqlite3'),
+        os.path.join(base_dir, 'processed_ids.sqlite3-wal'),
+        os.path.join(base_dir, 'processed_ids.sqlite3-shm')
     ]
 
     # 하위 디렉토리 삭제 및 재생성